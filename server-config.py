@@ -19,22 +19,68 @@ Note: World sync commands (world-download, world-upload) are in MCC/server-confi
 """
 
 import os
+import re
 import sys
 import shutil
 import socket
+import stat
 import struct
-import subprocess
+import threading
+import argparse
+import atexit
+import errno
+import functools
+import importlib
+import time
 from datetime import datetime
 
+
+class _Lazy:
+    """Stand-in that loads the real object on first use (attribute or call).
+
+    Rich takes ~50 ms to import; commands that print nothing through it,
+    like a successful `rcon`, never pay for it. subprocess is deferred the
+    same way, for commands that never launch a process.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._obj = None
+
+    def resolve(self):
+        """Return the real object (for APIs that need the instance itself)."""
+        if self._obj is None:
+            self._obj = self._loader()
+        return self._obj
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+
+def _lazy_import(module, attr=None):
+    """Lazy stand-in for a module, or for one attribute of it."""
+    if attr is None:
+        return _Lazy(lambda: importlib.import_module(module))
+    return _Lazy(lambda: getattr(importlib.import_module(module), attr))
+
+
+# Only needed by commands that run java, git, packwiz or a native copier
+subprocess = _lazy_import("subprocess")
+
 # Rich library for pretty output
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn, TransferSpeedColumn, FileSizeColumn
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+Console = _lazy_import("rich.console", "Console")
+Confirm = _lazy_import("rich.prompt", "Confirm")
+Prompt = _lazy_import("rich.prompt", "Prompt")
+Table = _lazy_import("rich.table", "Table")
+Panel = _lazy_import("rich.panel", "Panel")
+box = _lazy_import("rich.box")
+escape = _lazy_import("rich.markup", "escape")
 
 # Initialize rich console
-console = Console()
+console = _Lazy(Console)
 
 # =============================================================================
 # Configuration
@@ -43,6 +89,13 @@ console = Console()
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 MCC_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "MCC"))
 
+# Fixed paths inside SCRIPT_DIR
+PROPS_FILE = os.path.join(SCRIPT_DIR, "server.properties")
+MODS_DIR = os.path.join(SCRIPT_DIR, "mods")
+CONFIG_DIR = os.path.join(SCRIPT_DIR, "config")
+PACKWIZ_BOOTSTRAP = os.path.join(SCRIPT_DIR, "packwiz-installer-bootstrap.jar")
+PACKWIZ_JSON = os.path.join(SCRIPT_DIR, "packwiz.json")
+
 # Java path - defaults to Prism Launcher's bundled JDK
 DEFAULT_JAVA = os.path.expandvars(r"%APPDATA%\PrismLauncher\java\java-runtime-delta\bin\java.exe")
 
@@ -53,8 +106,14 @@ RCON_HOST = "127.0.0.1"
 RCON_PORT = 25575
 RCON_PASSWORD = "testpassword"
 
+# Seconds to wait for an RCON reply; commands that flush the world to disk
+# can take much longer than the default on a large world
+RCON_TIMEOUT = 5
+RCON_SLOW_COMMANDS = ("save-all",)
+RCON_SLOW_TIMEOUT = 60
+
 # JVM flags (Aikar's optimized G1GC flags)
-JVM_FLAGS = [
+JVM_FLAGS = (
     "-Xms4G", "-Xmx4G",
     "-XX:+UseG1GC",
     "-XX:+ParallelRefProcEnabled",
@@ -76,7 +135,12 @@ JVM_FLAGS = [
     "-XX:MaxTenuringThreshold=1",
     "-Dusing.aikars.flags=https://mcflags.emc.gs",
     "-Daikars.new.flags=true",
-]
+)
+_CMD_SUFFIX = ("-jar", SERVER_JAR, "nogui")
+
+# Launcher written next to the server jar so the server can be started
+# without going through this script (e.g. by an external supervisor)
+LAUNCHER_FILE = "start-server.bat" if sys.platform == 'win32' else "start-server.sh"
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -96,6 +160,16 @@ DH_FILE_PATTERNS = [
 # Cold storage directory for DistantHorizons data
 DH_COLD_STORAGE = "distant-horizons-cold"
 
+# World folder pairs: (backup, working, backup path, working path)
+WORLD_PAIRS = tuple(
+    (backup, working, os.path.join(SCRIPT_DIR, backup), os.path.join(SCRIPT_DIR, working))
+    for backup, working in (
+        ("world-production", "world-local"),
+        ("world-production_nether", "world-local_nether"),
+        ("world-production_the_end", "world-local_the_end"),
+    )
+)
+
 
 def format_duration(seconds):
     """Format elapsed time in human-readable format."""
@@ -111,16 +185,20 @@ def format_duration(seconds):
         return f"{hours}h {minutes}m"
 
 
+# (unit, divisor, decimals), largest first
+SIZE_UNITS = (
+    ("GB", 1 << 30, 2),
+    ("MB", 1 << 20, 1),
+    ("KB", 1 << 10, 1),
+)
+
+
 def format_size(size_bytes):
     """Format byte size in human-readable format."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    for unit, divisor, decimals in SIZE_UNITS:
+        if size_bytes >= divisor:
+            return f"{size_bytes / divisor:.{decimals}f} {unit}"
+    return f"{size_bytes} B"
 
 
 def is_dh_file(filename):
@@ -128,12 +206,427 @@ def is_dh_file(filename):
     return any(filename.endswith(pattern) for pattern in DH_FILE_PATTERNS)
 
 
+# =============================================================================
+# Filesystem Helpers
+# =============================================================================
+
+# os.sendfile only accepts a regular-file destination on Linux
+SENDFILE_TO_FILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+# copy_file_range (Linux 4.5+) copies without reading the data at all on
+# filesystems that support reflinks or server-side copy
+COPY_FILE_RANGE = SENDFILE_TO_FILE and hasattr(os, 'copy_file_range')
+
+# Threads for small-file copies in sync_tree
+SYNC_WORKERS = 8
+
+# Buffer for streamed copies that can't go in-kernel (shutil defaults to 64 KB
+# outside Windows)
+COPY_BUFSIZE = 1024 * 1024
+
+
+def dirs_in(path):
+    """Return the names of the subdirectories of path, from one directory listing.
+
+    Replaces an os.path.exists() call per candidate folder with a single
+    scandir; set membership is then free.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {e.name for e in it if e.is_dir(follow_symlinks=False)}
+    except FileNotFoundError:
+        return set()
+
+
+def _dir_size_scandir(path):
+    """dir_size() via scandir: sizes come with the directory listing on Windows."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass  # Vanished or unreadable folder (e.g. server writing)
+    return total
+
+
+def _dir_size_fwalk(path):
+    """dir_size() via os.fwalk: each stat is fstatat() relative to an open
+    directory fd, so the kernel doesn't re-resolve the full path per file."""
+    total = 0
+    stat_at = os.stat
+    try:
+        for _, _, files, dir_fd in os.fwalk(path):
+            for name in files:
+                try:
+                    total += stat_at(name, dir_fd=dir_fd, follow_symlinks=False).st_size
+                except OSError:
+                    pass  # Removed while walking
+    except OSError:
+        pass  # Top folder vanished
+    return total
+
+
+# fwalk needs dir_fd support (POSIX); Windows keeps the scandir walk
+DIR_SIZE = _dir_size_fwalk if hasattr(os, 'fwalk') and os.stat in os.supports_dir_fd else _dir_size_scandir
+
+
+def dir_size(path):
+    """Total size in bytes of the files under path."""
+    return DIR_SIZE(path)
+
+
+def _kernel_copy(src_fd, dst_fd, offset, count):
+    """Copy count bytes from src_fd at offset to dst_fd's position in-kernel.
+
+    Tries copy_file_range first (clones extents on Btrfs/XFS), then
+    sendfile. Raises OSError if the filesystem refuses both.
+    """
+    if COPY_FILE_RANGE:
+        try:
+            while count:
+                copied = os.copy_file_range(src_fd, dst_fd, count, offset)
+                if not copied:
+                    break
+                offset += copied
+                count -= copied
+        except OSError:
+            pass  # Cross-filesystem on older kernels - sendfile the rest
+    while count:
+        sent = os.sendfile(dst_fd, src_fd, offset, count)
+        if not sent:
+            raise OSError("sendfile stopped short")
+        offset += sent
+        count -= sent
+
+
+def fast_copyfile(src, dst):
+    """Copy file contents only (no metadata), in-kernel on Linux.
+
+    Usable as a shutil.copytree copy_function. Configs are regenerated
+    freely, so the copystat() work done by shutil.copy2 is skipped.
+    """
+    if not SENDFILE_TO_FILE:
+        return shutil.copyfile(src, dst)
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            _kernel_copy(fsrc.fileno(), fdst.fileno(), 0, os.fstat(fsrc.fileno()).st_size)
+            return dst
+        except OSError:
+            # Filesystem refused in-kernel copy
+            pass
+    return shutil.copyfile(src, dst)
+
+
+def _robocopy_tree(src, dst, mirror=False):
+    """Copy a directory tree with robocopy's multithreaded engine (Windows).
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        mirror: If True, use /MIR so dst ends up an exact copy: only changed
+            files are copied and files missing from src are deleted
+    """
+    result = subprocess.run(
+        ["robocopy", src, dst, "/MIR" if mirror else "/E",
+         "/MT:32", "/NFL", "/NDL", "/NJH", "/NJS", "/NP", "/R:1", "/W:1"],
+        capture_output=True,
+        text=True
+    )
+    # robocopy exit codes 0-7 are success variants (1 = files copied)
+    if result.returncode >= 8:
+        raise OSError(f"robocopy failed with exit code {result.returncode}")
+
+
+def _cp_tree(src, dst):
+    """Copy a directory tree with cp -a (macOS/Linux).
+
+    Requests a copy-on-write clone where the filesystem supports it
+    (reflink on Btrfs/XFS, clonefile on APFS), which shares extents
+    instead of copying data. Other filesystems get a regular copy.
+    """
+    if sys.platform == 'darwin':
+        cmd = ["cp", "-a", "-c", src, dst]
+    else:
+        cmd = ["cp", "-a", "--reflink=auto", src, dst]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise OSError(result.stderr.strip() or f"cp failed with exit code {result.returncode}")
+
+
+def _pick_fast_copytree():
+    """Pick the fastest available tree copier for this platform."""
+    if sys.platform == 'win32':
+        if shutil.which("robocopy"):
+            return _robocopy_tree
+    elif shutil.which("cp"):
+        return _cp_tree
+    return shutil.copytree
+
+
+# Resolved once at import so the platform dispatch isn't repeated per copy
+COPYTREE = _pick_fast_copytree()
+
+
+def fast_copytree(src, dst):
+    """Copy a directory tree using a native copier when available.
+
+    World folders hold tens of thousands of small region files, which
+    shutil.copytree copies one at a time. Like shutil.copytree, dst must
+    not already exist. Falls back to shutil.copytree if the native tool fails.
+    """
+    if os.path.exists(dst):
+        raise FileExistsError(f"Destination already exists: {dst}")
+    try:
+        COPYTREE(src, dst)
+    except OSError:
+        if COPYTREE is shutil.copytree:
+            raise
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+
+
+def sync_file(entry, dst, current=None):
+    """Copy a file unless dst already has the same size and mtime.
+
+    Args:
+        entry: os.DirEntry for the source file
+        dst: Destination path
+        current: os.DirEntry for dst if the caller already listed it
+
+    Returns 1 if the file was copied, 0 if it was already up to date.
+    """
+    src_stat = entry.stat()
+    try:
+        dst_stat = current.stat() if current is not None else os.stat(dst)
+        if stat.S_ISDIR(dst_stat.st_mode):
+            fast_rmtree(dst)
+        elif dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return 0
+    except FileNotFoundError:
+        pass
+
+    fast_copyfile(entry.path, dst)
+    # Carry the source mtime over so the next sync can skip this file
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return 1
+
+
+def _plan_sync(src, dst, delete_extra, jobs):
+    """Walk src for sync_tree: create/clean dst directories, queue file syncs.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+        delete_extra: Remove entries in dst that don't exist in src
+        jobs: List that (entry, target, current) sync_file arguments are appended to
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(dst) as it:
+        existing = {e.name: e for e in it}
+
+    # prefix + name instead of os.path.join per entry
+    prefix = os.path.join(dst, "")
+    with os.scandir(src) as it:
+        for entry in it:
+            target = prefix + entry.name
+            current = existing.pop(entry.name, None)
+            if entry.is_dir(follow_symlinks=False):
+                if current is not None and not current.is_dir(follow_symlinks=False):
+                    os.remove(target)
+                _plan_sync(entry.path, target, True, jobs)
+            else:
+                jobs.append((entry, target, current))
+
+    if delete_extra:
+        for stale in existing.values():
+            if stale.is_dir(follow_symlinks=False):
+                fast_rmtree(stale.path)
+            else:
+                os.remove(stale.path)
+
+
+def sync_tree(src, dst, delete_extra=True):
+    """Make dst match src, copying only files whose size or mtime changed.
+
+    Directories are walked (and created) first; the per-file checks and
+    copies then run on a thread pool, since most config files are tiny and
+    the time goes to per-file syscalls rather than bandwidth.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+        delete_extra: Remove entries in dst that don't exist in src.
+                      Always applied to subdirectories.
+
+    Returns the number of files copied.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    jobs = []
+    _plan_sync(src, dst, delete_extra, jobs)
+    if len(jobs) < 2:
+        return sum(sync_file(*job) for job in jobs)
+
+    with ThreadPoolExecutor(max_workers=min(SYNC_WORKERS, len(jobs))) as pool:
+        return sum(pool.map(lambda job: sync_file(*job), jobs))
+
+
+def _rsync_mirror(src, dst):
+    """Mirror a directory tree with rsync --delete (macOS/Linux)."""
+    result = subprocess.run(
+        ["rsync", "-a", "--delete", src + os.sep, dst + os.sep],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise OSError(result.stderr.strip() or f"rsync failed with exit code {result.returncode}")
+
+
+def _pick_mirror_tree():
+    """Pick a delta-sync tool for this platform, or None if there isn't one."""
+    if sys.platform == 'win32':
+        if shutil.which("robocopy"):
+            return functools.partial(_robocopy_tree, mirror=True)
+    elif shutil.which("rsync"):
+        return _rsync_mirror
+    return None
+
+
+MIRROR_TREE = _pick_mirror_tree()
+
+
+def mirror_tree(src, dst):
+    """Make dst an exact copy of src, transferring only files that differ.
+
+    Resetting a working world that drifted by a few chunks only rewrites
+    those chunks. Without robocopy/rsync, dst is deleted and copied fresh.
+    """
+    if MIRROR_TREE is not None:
+        try:
+            MIRROR_TREE(src, dst)
+            return
+        except OSError:
+            pass
+    if os.path.exists(dst):
+        fast_rmtree(dst)
+    fast_copytree(src, dst)
+
+
+def _rd_tree(path):
+    """Delete a directory tree with rd /s /q (Windows)."""
+    result = subprocess.run(["cmd", "/c", "rd", "/s", "/q", path], capture_output=True, text=True)
+    # rd exits 0 even when some files were locked, so check the result
+    if result.returncode != 0 or os.path.exists(path):
+        raise OSError(result.stderr.strip() or f"rd failed to remove {path}")
+
+
+def _rm_tree(path):
+    """Delete a directory tree with rm -rf (macOS/Linux)."""
+    result = subprocess.run(["rm", "-rf", "--", path], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise OSError(result.stderr.strip() or f"rm failed with exit code {result.returncode}")
+
+
+def _pick_fast_rmtree():
+    """Pick a native tree delete for this platform, or None to use shutil."""
+    if sys.platform == 'win32':
+        return _rd_tree
+    if shutil.which("rm"):
+        return _rm_tree
+    return None
+
+
+RMTREE = _pick_fast_rmtree()
+
+
+def fast_rmtree(path):
+    """Delete a directory tree, using the platform's native tool if available.
+
+    World folders hold tens of thousands of region/entity files; rd and
+    rm -rf remove them far faster than shutil.rmtree's per-file Python loop.
+    Falls back to shutil.rmtree, which also reports what couldn't be removed.
+    """
+    if RMTREE is not None:
+        try:
+            RMTREE(path)
+            return
+        except OSError:
+            pass
+    shutil.rmtree(path)
+
+
+def rmtree_in_background(path):
+    """Move a directory tree aside and delete it on a background thread.
+
+    The rename is instant, so path can be refilled right away while the
+    disk-bound delete runs. Returns the thread to join, or None if the tree
+    couldn't be moved and was deleted in place instead.
+    """
+    trash = f"{path}.deleting-{os.getpid()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        fast_rmtree(path)
+        return None
+
+    def delete():
+        try:
+            fast_rmtree(trash)
+        except OSError as e:
+            console.print(f"[yellow]Warning: could not remove {os.path.basename(trash)}: {e}[/yellow]")
+
+    thread = threading.Thread(target=delete)
+    thread.start()
+    return thread
+
+
+def copy_trees_parallel(jobs, copy=fast_copytree):
+    """Copy independent directory trees concurrently.
+
+    The overworld, nether and end folders don't share files, so their copies
+    can overlap instead of running back to back.
+
+    Args:
+        jobs: List of (src, dst, done_message) tuples; done_message is
+              printed as each copy finishes
+        copy: Tree copy function taking (src, dst)
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {pool.submit(copy, src, dst): message for src, dst, message in jobs}
+        for future in as_completed(futures):
+            future.result()
+            console.print(futures[future])
+
+
 # =============================================================================
 # Environment Loading
 # =============================================================================
 
+# KEY=value lines; comments and blank lines don't match. Whitespace around
+# the key and value is dropped.
+ENV_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.M)
+
+# Every setting this script reads from the environment
+ENV_KEYS = ("SFTP_HOST", "SFTP_PORT", "SFTP_USERNAME", "SFTP_PASSWORD", "JAVA_PATH")
+
+
 def load_dotenv():
     """Load environment variables from .env file"""
+    # Nothing to fill in if the environment already provides every setting
+    if all(key in os.environ for key in ENV_KEYS):
+        return
+
     # Check LocalServer .env first, then fall back to MCC .env
     env_paths = [
         os.path.join(SCRIPT_DIR, '.env'),
@@ -141,22 +634,60 @@ def load_dotenv():
     ]
 
     for env_path in env_paths:
-        if os.path.exists(env_path):
+        try:
             with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ.setdefault(key.strip(), value.strip())
-            break
+                text = f.read()
+        except FileNotFoundError:
+            continue
+        for key, value in ENV_LINE_RE.findall(text):
+            os.environ.setdefault(key, value)
+        break
 
-load_dotenv()
 
-# SFTP credentials (for production world sync)
-SFTP_HOST = os.environ.get("SFTP_HOST", "")
-SFTP_PORT = int(os.environ.get("SFTP_PORT", "2022"))
-SFTP_USERNAME = os.environ.get("SFTP_USERNAME", "")
-SFTP_PASSWORD = os.environ.get("SFTP_PASSWORD", "")
+# SFTP credentials (for production world sync) and Java path; filled in
+# from the environment / .env by load_settings()
+SFTP_HOST = ""
+SFTP_PORT = 2022
+SFTP_USERNAME = ""
+SFTP_PASSWORD = ""
+JAVA_PATH = DEFAULT_JAVA
+_SETTINGS_LOADED = False
+
+
+def load_settings():
+    """Read .env and the settings taken from the environment, once.
+
+    Deferred until a command needs them, so importing this module (or
+    running rcon/status) doesn't parse .env.
+    """
+    global _SETTINGS_LOADED, SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD, JAVA_PATH
+    if _SETTINGS_LOADED:
+        return
+    _SETTINGS_LOADED = True
+
+    load_dotenv()
+    SFTP_HOST = os.environ.get("SFTP_HOST", "")
+    SFTP_PORT = int(os.environ.get("SFTP_PORT", "2022"))
+    SFTP_USERNAME = os.environ.get("SFTP_USERNAME", "")
+    SFTP_PASSWORD = os.environ.get("SFTP_PASSWORD", "")
+    JAVA_PATH = os.environ.get("JAVA_PATH", DEFAULT_JAVA)
+
+
+# Parallel SFTP channels used for world downloads (all share one SSH connection)
+SFTP_DOWNLOAD_WORKERS = 8
+
+# OpenSSH's default MaxSessions: channels one SSH connection may have open
+SFTP_MAX_SESSIONS = 10
+
+# Per-channel SSH flow-control window. paramiko's 2 MB default stalls each
+# channel waiting for window adjustments on high-latency links.
+SFTP_WINDOW_SIZE = 16 * 1024 * 1024
+
+# Bytes handed from a prefetched remote file to the local file per write
+SFTP_READ_SIZE = 1024 * 1024
+
+# Files below this size only report progress when they complete
+PROGRESS_MIN_SIZE = 256 * 1024
 
 
 # =============================================================================
@@ -193,8 +724,39 @@ def get_mcc_git_tags():
         return []
 
 
+def _mcc_ref_stamp():
+    """mtimes of the MCC git files that change when HEAD moves or refs change.
+
+    Returns None when MCC isn't a plain .git checkout (e.g. a worktree),
+    in which case nothing is cached.
+    """
+    git_dir = os.path.join(MCC_DIR, ".git")
+    stamp = []
+    for rel in ("HEAD", "packed-refs", os.path.join("refs", "heads"), os.path.join("refs", "tags")):
+        try:
+            stamp.append(os.stat(os.path.join(git_dir, rel)).st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(0)
+        except OSError:
+            return None
+    return tuple(stamp) if stamp[0] else None
+
+
 def get_mcc_current_version():
-    """Get the current version/branch of MCC repository."""
+    """Get the current version/branch of MCC repository.
+
+    The interactive menu asks on every redraw; the answer is reused until
+    HEAD or the refs change, saving up to three git processes per redraw.
+    """
+    stamp = _mcc_ref_stamp()
+    if stamp is None:
+        return _mcc_current_version.__wrapped__(None)
+    return _mcc_current_version(stamp)
+
+
+@functools.lru_cache(maxsize=4)
+def _mcc_current_version(stamp):
+    """Look up the MCC version; stamp is only a cache key."""
     try:
         # First try to get exact tag if HEAD is at a tag
         result = subprocess.run(
@@ -328,9 +890,6 @@ def pop_mcc_stash():
     except Exception as e:
         return False, str(e)
 
-# Java path (can be overridden via env)
-JAVA_PATH = os.environ.get("JAVA_PATH", DEFAULT_JAVA)
-
 
 # =============================================================================
 # RCON Client
@@ -344,18 +903,33 @@ class RCONClient:
     SERVERDATA_EXECCOMMAND = 2
     SERVERDATA_RESPONSE_VALUE = 0
 
-    def __init__(self, host, port, password):
+    # Precompiled packet layouts: header (length, request id, type) and int32
+    _HEADER = struct.Struct('<iii')
+    _INT32 = struct.Struct('<i')
+
+    def __init__(self, host, port, password, timeout=RCON_TIMEOUT):
         self.host = host
         self.port = port
         self.password = password
+        self.timeout = timeout
         self.socket = None
+        self.selector = None
         self.request_id = 0
 
     def connect(self):
         """Connect to RCON server"""
+        import selectors
+
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.settimeout(5)
+        # Small request/response packets: don't let Nagle hold them back,
+        # and keep the pooled connection alive while idle
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.socket.settimeout(self.timeout)
         self.socket.connect((self.host, self.port))
+        # Reads wait for readiness here, so each call can choose its own timeout
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket, selectors.EVENT_READ)
         return self._authenticate()
 
     def _authenticate(self):
@@ -363,36 +937,109 @@ class RCONClient:
         response = self._send_packet(self.SERVERDATA_AUTH, self.password)
         return response is not None and response[0] != -1
 
-    def command(self, cmd):
-        """Send a command and return the response"""
-        response = self._send_packet(self.SERVERDATA_EXECCOMMAND, cmd)
+    def command(self, cmd, timeout=None):
+        """Send a command and return the response
+
+        Args:
+            cmd: Command text
+            timeout: Seconds to wait for the reply (default: self.timeout)
+        """
+        response = self._send_packet(self.SERVERDATA_EXECCOMMAND, cmd, timeout)
         if response:
             return response[1]
         return None
 
-    def _send_packet(self, packet_type, payload):
+    def send_many(self, cmds, timeout=None):
+        """Send several commands back to back and return their responses in order.
+
+        All packets go out in one write; replies are matched up by request id,
+        so N commands cost one round-trip instead of N. A command that gets
+        no reply before the timeout has None as its response.
+
+        Returns (responses, complete). complete is False if the timeout hit
+        first, in which case late packets may still arrive on the socket.
+        """
+        first_id = self.request_id + 1
+        packets = []
+        for cmd in cmds:
+            self.request_id += 1
+            packets.append(self._encode_packet(self.request_id, self.SERVERDATA_EXECCOMMAND, cmd))
+        # The server answers in order, so the reply to this empty packet
+        # arrives only after every fragment of the last command's reply
+        self.request_id += 1
+        sentinel_id = self.request_id
+        packets.append(self._encode_packet(sentinel_id, self.SERVERDATA_RESPONSE_VALUE, ""))
+        self.socket.sendall(b"".join(packets))
+
+        # Long replies arrive split over several packets with the same id.
+        # The split is by byte count and can cut a UTF-8 character in two,
+        # so fragments are joined as bytes and decoded once at the end.
+        fragments = {}
+        complete = False
+        try:
+            while True:
+                length = self._INT32.unpack(self._recv_exact(4, timeout))[0]
+                data = self._recv_exact(length, timeout)
+                request_id = self._INT32.unpack_from(data, 0)[0]
+                if request_id == sentinel_id:
+                    complete = True
+                    break
+                fragments.setdefault(request_id, bytearray()).extend(data[8:-2])
+        except socket.timeout:
+            pass
+        # A reply cut short by the timeout may end mid-character
+        errors = 'strict' if complete else 'replace'
+        responses = []
+        for i in range(len(cmds)):
+            reply = fragments.get(first_id + i)
+            responses.append(None if reply is None else reply.decode('utf-8', errors))
+        return responses, complete
+
+    def _recv_exact(self, n, timeout=None):
+        """Read exactly n bytes; recv() may return a partial TCP segment.
+
+        Reads straight into one preallocated buffer rather than
+        concatenating the pieces. Raises socket.timeout if no data arrives
+        within timeout seconds (default: self.timeout).
+        """
+        if timeout is None:
+            timeout = self.timeout
+        buf = bytearray(n)
+        view = memoryview(buf)
+        got = 0
+        while got < n:
+            if not self.selector.select(timeout):
+                raise socket.timeout("RCON reply timed out")
+            count = self.socket.recv_into(view[got:])
+            if not count:
+                raise ConnectionError("RCON connection closed by server")
+            got += count
+        return buf
+
+    def _send_packet(self, packet_type, payload, timeout=None):
         """Send a packet and receive response"""
         self.request_id += 1
         packet = self._encode_packet(self.request_id, packet_type, payload)
-        self.socket.send(packet)
-        return self._receive_packet()
+        self.socket.sendall(packet)
+        return self._receive_packet(timeout)
 
     def _encode_packet(self, request_id, packet_type, payload):
         """Encode an RCON packet"""
-        payload_bytes = payload.encode('utf-8') + b'\x00\x00'
-        length = 4 + 4 + len(payload_bytes)
-        return struct.pack('<iii', length, request_id, packet_type) + payload_bytes
-
-    def _receive_packet(self):
+        payload_bytes = payload.encode('utf-8')
+        # length field counts request id + type + payload + two NUL terminators
+        length = 4 + 4 + len(payload_bytes) + 2
+        packet = bytearray(4 + length)  # zero-filled, so the NULs are already there
+        self._HEADER.pack_into(packet, 0, length, request_id, packet_type)
+        packet[12:12 + len(payload_bytes)] = payload_bytes
+        return packet
+
+    def _receive_packet(self, timeout=None):
         """Receive and decode an RCON packet"""
         try:
-            length_data = self.socket.recv(4)
-            if len(length_data) < 4:
-                return None
-            length = struct.unpack('<i', length_data)[0]
-            data = self.socket.recv(length)
-            request_id = struct.unpack('<i', data[0:4])[0]
-            # packet_type = struct.unpack('<i', data[4:8])[0]
+            length = self._INT32.unpack(self._recv_exact(4, timeout))[0]
+            data = self._recv_exact(length, timeout)
+            request_id = self._INT32.unpack_from(data, 0)[0]
+            # packet_type = self._INT32.unpack_from(data, 4)[0]
             payload = data[8:-2].decode('utf-8')
             return (request_id, payload)
         except socket.timeout:
@@ -400,25 +1047,127 @@ class RCONClient:
 
     def close(self):
         """Close the connection"""
+        if self.selector:
+            self.selector.close()
+            self.selector = None
         if self.socket:
             self.socket.close()
             self.socket = None
 
 
+# Shared RCON connection, reused across commands to skip the connect + auth round-trip
+_RCON_POOL = None
+_RCON_LOCK = threading.Lock()
+
+
+def _get_rcon():
+    """Return the pooled RCON connection, connecting on first use.
+
+    Returns None if authentication fails.
+    """
+    global _RCON_POOL
+    with _RCON_LOCK:
+        if _RCON_POOL is None:
+            client = RCONClient(RCON_HOST, RCON_PORT, RCON_PASSWORD)
+            if not client.connect():
+                client.close()
+                return None
+            _RCON_POOL = client
+        return _RCON_POOL
+
+
+def _close_rcon():
+    """Close and discard the pooled RCON connection."""
+    global _RCON_POOL
+    with _RCON_LOCK:
+        if _RCON_POOL is not None:
+            _RCON_POOL.close()
+            _RCON_POOL = None
+
+
+atexit.register(_close_rcon)
+
+
+def _rcon_command(cmd):
+    """Send a command over the pooled RCON connection.
+
+    Reconnects once if the pooled socket has gone stale (e.g. server restarted).
+    Returns (authenticated, response).
+    """
+    timeout = RCON_SLOW_TIMEOUT if cmd.startswith(RCON_SLOW_COMMANDS) else None
+    for attempt in range(2):
+        rcon = _get_rcon()
+        if rcon is None:
+            return False, None
+        try:
+            response = rcon.command(cmd, timeout)
+        except OSError:
+            _close_rcon()
+            if attempt:
+                raise
+            continue
+        if response is None:
+            # Timed out: a late reply would be read as the next command's
+            # response, so don't hand this socket out again
+            _close_rcon()
+        return True, response
+
+
+def _rcon_batch(cmds):
+    """Send several commands, pipelined, over the pooled RCON connection.
+
+    Reconnects once if the pooled socket has gone stale, as _rcon_command() does.
+    Returns (authenticated, responses).
+    """
+    for attempt in range(2):
+        rcon = _get_rcon()
+        if rcon is None:
+            return False, None
+        try:
+            responses, complete = rcon.send_many(cmds)
+        except OSError:
+            _close_rcon()
+            if attempt:
+                raise
+            continue
+        if not complete:
+            _close_rcon()  # Late replies would desync the pooled socket
+        return True, responses
+
+
 # =============================================================================
 # Progress Tracking (for SFTP downloads)
 # =============================================================================
 
 class RichProgressTracker:
-    """Tracks download progress using Rich"""
+    """Tracks download progress using Rich.
+
+    Safe to share between download threads: each thread's in-flight file
+    gets its own progress row. The per-chunk update() only writes the
+    calling thread's own counter; the lock is taken to redraw (at most
+    30 Hz) and when a file starts or finishes.
+    """
     def __init__(self, total_files=1, total_size=0):
+        # rich.progress is slow to import and only needed for transfers
+        from rich.progress import (
+            Progress, SpinnerColumn, BarColumn, TextColumn,
+            TimeRemainingColumn, TransferSpeedColumn, FileSizeColumn
+        )
+
         self.total_files = total_files
         self.total_size = total_size
         self.current_file = 0
         self.files_succeeded = 0
         self.files_failed = 0
-        self.total_bytes_transferred = 0
-        self.previous_file_transferred = 0
+        self._finished_bytes = 0
+
+        # In-flight file per thread: ident -> [task_id, file_size, transferred]
+        self._active = {}
+        self._lock = threading.Lock()
+
+        # paramiko fires the callback every ~32 KB; cap redraws at 30 Hz
+        self._render_interval = 1 / 30
+        self._last_render = 0.0
 
         self.progress = Progress(
             SpinnerColumn(),
@@ -431,12 +1180,11 @@ class RichProgressTracker:
             TransferSpeedColumn(),
             "•",
             TimeRemainingColumn(),
-            console=console,
+            console=console.resolve(),
             expand=True
         )
 
         self.overall_task_id = None
-        self.current_file_task_id = None
 
     def __enter__(self):
         self.progress.__enter__()
@@ -450,75 +1198,82 @@ class RichProgressTracker:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.progress.__exit__(exc_type, exc_val, exc_tb)
 
-    def start_file(self, filename, file_size):
-        self.current_file += 1
-        self.previous_file_transferred = 0
+    @property
+    def total_bytes_transferred(self):
+        """Bytes of finished files plus what in-flight files have received."""
+        return self._finished_bytes + sum(state[2] for state in list(self._active.values()))
 
+    def _update_overall(self):
+        self.progress.update(
+            self.overall_task_id,
+            completed=min(self.total_bytes_transferred, self.total_size),
+            description=f"[cyan]Overall Progress ({self.files_succeeded + self.files_failed}/{self.total_files} files)"
+        )
+
+    def start_file(self, filename, file_size):
         display_name = filename
         if len(display_name) > 60:
             display_name = "..." + display_name[-57:]
 
-        if self.current_file_task_id is not None:
-            self.progress.remove_task(self.current_file_task_id)
-
-        self.current_file_task_id = self.progress.add_task(
-            f"[green]{display_name}",
-            total=file_size
-        )
+        ident = threading.get_ident()
+        with self._lock:
+            self.current_file += 1
+            previous = self._active.get(ident)
+            if previous is not None:
+                self.progress.remove_task(previous[0])
+            task_id = self.progress.add_task(f"[green]{display_name}", total=file_size)
+            self._active[ident] = [task_id, file_size, 0]
 
     def update(self, transferred, total):
-        if self.current_file_task_id is not None:
-            self.progress.update(self.current_file_task_id, completed=transferred)
-
-        if self.overall_task_id is not None:
-            delta = transferred - self.previous_file_transferred
-            if delta > 0:
-                self.total_bytes_transferred += delta
-                self.previous_file_transferred = transferred
-                self.progress.update(
-                    self.overall_task_id,
-                    completed=min(self.total_bytes_transferred, self.total_size),
-                    description=f"[cyan]Overall Progress ({self.files_succeeded + self.files_failed}/{self.total_files} files)"
-                )
+        # Only this thread writes its own entry, so no lock is needed here
+        state = self._active.get(threading.get_ident())
+        if state is None:
+            return
+        state[2] = transferred
+
+        now = time.monotonic()
+        if transferred < total and now - self._last_render < self._render_interval:
+            return
+
+        with self._lock:
+            self._last_render = now
+            self.progress.update(state[0], completed=transferred)
+            if self.overall_task_id is not None:
+                self._update_overall()
 
     def file_complete(self, success=True):
-        if success:
-            self.files_succeeded += 1
-            if self.current_file_task_id is not None:
-                task = self.progress._tasks.get(self.current_file_task_id)
-                if task and task.completed < task.total:
-                    remaining = task.total - task.completed
-                    self.total_bytes_transferred += remaining
-                if task:
-                    self.progress.update(self.current_file_task_id, completed=task.total)
-                self.progress.remove_task(self.current_file_task_id)
-                self.current_file_task_id = None
+        with self._lock:
+            state = self._active.pop(threading.get_ident(), None)
+            if success:
+                self.files_succeeded += 1
+            else:
+                self.files_failed += 1
 
-            if self.overall_task_id is not None:
-                self.progress.update(
-                    self.overall_task_id,
-                    completed=min(self.total_bytes_transferred, self.total_size),
-                    description=f"[cyan]Overall Progress ({self.files_succeeded + self.files_failed}/{self.total_files} files)"
-                )
-        else:
-            self.files_failed += 1
-            if self.current_file_task_id is not None:
-                task = self.progress._tasks.get(self.current_file_task_id)
-                if task:
-                    self.total_bytes_transferred += task.total
-                self.progress.remove_task(self.current_file_task_id)
-                self.current_file_task_id = None
+            if state is not None:
+                # Count the whole file, including bytes the callback didn't report
+                task_id, file_size, _ = state
+                self._finished_bytes += file_size
+                self.progress.remove_task(task_id)
 
-            if self.overall_task_id is not None:
-                self.progress.update(
-                    self.overall_task_id,
-                    completed=min(self.total_bytes_transferred, self.total_size),
-                    description=f"[cyan]Overall Progress ({self.files_succeeded + self.files_failed}/{self.total_files} files)"
-                )
+            # Refresh the overall bar every few files rather than after each one
+            done = self.files_succeeded + self.files_failed
+            if self.overall_task_id is not None and (done % 8 == 0 or done == self.total_files):
+                self._update_overall()
 
 
-def progress_callback(tracker):
-    """Create a callback function for paramiko"""
+def progress_callback(tracker, size=None):
+    """Create a callback function for paramiko.
+
+    Files smaller than PROGRESS_MIN_SIZE get no callback: they finish in a
+    chunk or two, and file_complete() accounts for their bytes anyway.
+
+    Args:
+        tracker: Progress tracker instance
+        size: File size in bytes, if known
+    """
+    if size is not None and size < PROGRESS_MIN_SIZE:
+        return None
+
     def callback(transferred, total):
         tracker.update(transferred, total)
     return callback
@@ -528,8 +1283,43 @@ def progress_callback(tracker):
 # SFTP Functions
 # =============================================================================
 
+def sftp_fetch(sftp, remote_path, local_path, size, callback=None):
+    """Download one file whose size is already known.
+
+    Unlike sftp.get(), this skips the per-file stat round-trip and
+    prefetches the whole file so its READ requests are all in flight
+    at once.
+
+    Args:
+        sftp: SFTP connection
+        remote_path: Remote file path
+        local_path: Local destination path
+        size: Remote file size in bytes
+        callback: Optional callback(transferred, total), as for sftp.get()
+
+    Raises:
+        IOError: if fewer or more bytes arrived than size, as sftp.get() does
+    """
+    transferred = 0
+    with sftp.open(remote_path, 'rb') as remote_file:
+        remote_file.prefetch(size)
+        with open(local_path, 'wb') as local_file:
+            while True:
+                data = remote_file.read(SFTP_READ_SIZE)
+                if not data:
+                    break
+                local_file.write(data)
+                transferred += len(data)
+                if callback:
+                    callback(transferred, size)
+    if transferred != size:
+        raise IOError(f"size mismatch in get!  {transferred} != {size}")
+    return transferred
+
+
 def check_sftp_credentials():
     """Check if SFTP credentials are configured"""
+    load_settings()
     if not SFTP_HOST or not SFTP_USERNAME or not SFTP_PASSWORD:
         console.print("[red]Error: SFTP credentials not configured![/red]")
         console.print("[yellow]Create a .env file with:[/yellow]")
@@ -541,86 +1331,285 @@ def check_sftp_credentials():
     return True
 
 
+_SSH_POOL = None
+_SSH_LOCK = threading.Lock()
+_SFTP_IDLE = []  # Open SFTP channels on _SSH_POOL waiting to be reused
+
+
 def get_sftp_connection():
-    """Create and return an SFTP connection"""
+    """Return the shared SSH client and a new SFTP channel on it.
+
+    The SSH session is kept open between operations so later transfers in
+    the same run skip the TCP connect and key exchange. Callers close only
+    the SFTP channel; the session is closed at exit.
+    """
     import paramiko
 
+    global _SSH_POOL
+
     if not check_sftp_credentials():
         return None, None
 
-    ssh = paramiko.SSHClient()
-    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    ssh.connect(SFTP_HOST, port=SFTP_PORT, username=SFTP_USERNAME, password=SFTP_PASSWORD)
-    sftp = ssh.open_sftp()
-    return ssh, sftp
+    with _SSH_LOCK:
+        if _SSH_POOL is not None:
+            transport = _SSH_POOL.get_transport()
+            if transport is None or not transport.is_active():
+                _SSH_POOL.close()
+                _SSH_POOL = None
+                del _SFTP_IDLE[:]
+        if _SSH_POOL is None:
+            ssh = paramiko.SSHClient()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            ssh.connect(SFTP_HOST, port=SFTP_PORT, username=SFTP_USERNAME, password=SFTP_PASSWORD)
+            _SSH_POOL = ssh
+        return _SSH_POOL, paramiko.SFTPClient.from_transport(
+            _SSH_POOL.get_transport(), window_size=SFTP_WINDOW_SIZE
+        )
+
+
+def acquire_sftp_channels(transport, count):
+    """Return up to `count` SFTP channels on a transport, reusing idle ones.
+
+    Channels handed back with release_sftp_channels() are kept open, so a
+    second download in the same run skips opening them again. Fewer than
+    `count` are returned if the server refuses more channels.
+    """
+    import paramiko
+
+    clients = []
+    with _SSH_LOCK:
+        while _SFTP_IDLE and len(clients) < count:
+            client = _SFTP_IDLE.pop()
+            channel = client.get_channel()
+            if channel.get_transport() is transport and not channel.closed:
+                clients.append(client)
+            else:
+                client.close()
+    while len(clients) < count:
+        try:
+            clients.append(paramiko.SFTPClient.from_transport(transport, window_size=SFTP_WINDOW_SIZE))
+        except Exception:
+            break  # Server caps channels per session - use what we have
+    return clients
+
+
+def release_sftp_channels(clients):
+    """Hand channels from acquire_sftp_channels() back for reuse."""
+    with _SSH_LOCK:
+        for client in clients:
+            if client.get_channel().closed:
+                continue
+            _SFTP_IDLE.append(client)
+
+
+def _close_ssh():
+    """Close and discard the shared SSH session."""
+    global _SSH_POOL
+    with _SSH_LOCK:
+        del _SFTP_IDLE[:]
+        if _SSH_POOL is not None:
+            _SSH_POOL.close()
+            _SSH_POOL = None
+
+
+atexit.register(_close_ssh)
 
 
 # =============================================================================
 # Status Functions
 # =============================================================================
 
+# Display color per server mode (status line and interactive menu)
+MODE_COLORS = {
+    "production": "cyan",
+    "fresh": "green",
+    "vanilla": "yellow",
+    "unknown": "dim"
+}
+
+
+# connect_ex() codes for "nothing listening" (Windows reports WSAECONNREFUSED)
+CONNECTION_REFUSED = {errno.ECONNREFUSED, getattr(errno, "WSAECONNREFUSED", errno.ECONNREFUSED)}
+
+# Last port probe: (time.monotonic() it was taken, running). Reused for
+# RUNNING_CACHE_TTL seconds so back-to-back checks (menu redraw, then the
+# chosen action) don't each probe; cleared when we start or stop the server.
+RUNNING_CACHE_TTL = 0.5
+_RUNNING_CACHE = None
+
+
+def forget_server_state():
+    """Drop the cached is_server_running() result."""
+    global _RUNNING_CACHE
+    _RUNNING_CACHE = None
+
+
 def is_server_running():
     """Check if Minecraft server is running by testing port"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(1)
-    result = sock.connect_ex(('127.0.0.1', SERVER_PORT))
-    sock.close()
-    return result == 0
+    global _RUNNING_CACHE
+    now = time.monotonic()
+    if _RUNNING_CACHE is not None and now - _RUNNING_CACHE[0] < RUNNING_CACHE_TTL:
+        return _RUNNING_CACHE[1]
+    running = _probe_server_port()
+    _RUNNING_CACHE = (now, running)
+    return running
+
+
+def _probe_server_port():
+    """Test whether anything is listening on the server port."""
+    # A stopped server refuses at once; a slow answer from a server that is
+    # still starting gets one more try rather than reading as STOPPED
+    for attempt in range(2):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(0.25)
+        try:
+            result = sock.connect_ex(('127.0.0.1', SERVER_PORT))
+        except socket.timeout:
+            result = errno.ETIMEDOUT
+        finally:
+            sock.close()
+        if result == 0:
+            return True
+        if result in CONNECTION_REFUSED:
+            return False
+    return False
+
+
+# level-name -> mode
+LEVEL_MODES = {
+    "world-local": "production",
+    "world-fresh": "fresh",
+    "world-vanilla": "vanilla",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_props(path, mtime_ns):
+    """Parse a .properties file into a dict (cached per file version via mtime_ns)."""
+    with open(path, 'r') as f:
+        data = f.read()
+    return dict(
+        line.split('=', 1) for line in data.splitlines()
+        if '=' in line and not line.startswith('#')
+    )
+
+
+def read_props(path):
+    """Return the key/value pairs of a .properties file, or None if it's missing."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _parse_props(path, mtime_ns)
 
 
 def get_current_mode():
     """Get current server mode from server.properties"""
-    props_file = os.path.join(SCRIPT_DIR, "server.properties")
-    if not os.path.exists(props_file):
+    props = read_props(PROPS_FILE)
+    if props is None:
         return "unknown"
+    return LEVEL_MODES.get(props.get("level-name", "").strip(), "unknown")
+
+
+# World sizes from previous status runs: folder -> {"stamp": [...], "size": bytes}
+SIZE_CACHE_FILE = os.path.join(SCRIPT_DIR, ".localserver-cache.json")
+
+
+def _world_stamp(path):
+    """Cheap change marker for a world folder: its mtime plus the newest top-level entry.
+
+    Adding/removing files touches the folder mtime, and every server save
+    rewrites level.dat at the top level, so a changed world changes its stamp
+    without walking every region file.
+    """
+    stamp = [os.stat(path).st_mtime_ns, 0]
+    with os.scandir(path) as it:
+        for entry in it:
+            stamp[1] = max(stamp[1], entry.stat(follow_symlinks=False).st_mtime_ns)
+    return stamp
+
+
+def _cached_world_sizes(worlds):
+    """Return {world: size} for folders under SCRIPT_DIR, walking only changed ones."""
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        with open(SIZE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    sizes = {}
+    stale = {}
+    for world in worlds:
+        try:
+            stamp = _world_stamp(os.path.join(SCRIPT_DIR, world))
+        except OSError:
+            continue
+        entry = cache.get(world)
+        if entry is not None and entry.get("stamp") == stamp:
+            sizes[world] = entry["size"]
+        else:
+            stale[world] = stamp
+
+    if stale:
+        # Each folder is an independent directory walk, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+            walked = pool.map(dir_size, [os.path.join(SCRIPT_DIR, w) for w in stale])
+            for world, size in zip(stale, walked):
+                sizes[world] = size
+                cache[world] = {"stamp": stale[world], "size": size}
+        try:
+            with open(SIZE_CACHE_FILE, 'w') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass  # Cache is only an optimization
+
+    return sizes
+
+
+def show_status(quick=False, as_json=False):
+    """Display current server status
 
-    with open(props_file, 'r') as f:
-        for line in f:
-            if line.startswith('level-name='):
-                level_name = line.split('=', 1)[1].strip()
-                if level_name == "world-local":
-                    return "production"
-                elif level_name == "world-fresh":
-                    return "fresh"
-                elif level_name == "world-vanilla":
-                    return "vanilla"
-    return "unknown"
-
-
-def show_status():
-    """Display current server status"""
+    Args:
+        quick: Only report mode and running state (skip sizing world folders)
+        as_json: Print a JSON object instead of the formatted report
+    """
     mode = get_current_mode()
     running = is_server_running()
 
-    mode_colors = {
-        "production": "cyan",
-        "fresh": "green",
-        "vanilla": "yellow",
-        "unknown": "dim"
-    }
-    mode_color = mode_colors.get(mode, "dim")
+    world_info = [
+        ("world-production", "Backup from production (pristine)"),
+        ("world-local", "Working copy for Production mode"),
+        ("world-fresh", "Fresh World mode"),
+        ("world-vanilla", "Vanilla Debug mode"),
+    ]
+    sizes = {}
+    if not quick:
+        present = dirs_in(SCRIPT_DIR)
+        sizes = _cached_world_sizes([world for world, _ in world_info if world in present])
+
+    if as_json:
+        import json
+        print(json.dumps({"mode": mode, "running": running, "worlds": sizes}))
+        return
+
+    mode_color = MODE_COLORS.get(mode, "dim")
     status_color = "green" if running else "red"
     status_text = "RUNNING" if running else "STOPPED"
 
     console.print(f"\n[bold]Current Mode:[/bold] [{mode_color}]{mode.upper()}[/{mode_color}]")
     console.print(f"[bold]Server Status:[/bold] [{status_color}]{status_text}[/{status_color}]")
 
+    if quick:
+        return
+
     # Show world folders
     console.print(f"\n[bold]World Folders:[/bold]")
-    world_info = [
-        ("world-production", "Backup from production (pristine)"),
-        ("world-local", "Working copy for Production mode"),
-        ("world-fresh", "Fresh World mode"),
-        ("world-vanilla", "Vanilla Debug mode"),
-    ]
     for world, description in world_info:
-        path = os.path.join(SCRIPT_DIR, world)
-        if os.path.exists(path):
-            size = sum(os.path.getsize(os.path.join(dirpath, filename))
-                      for dirpath, dirnames, filenames in os.walk(path)
-                      for filename in filenames)
-            size_str = f"{size / (1024*1024):.1f} MB" if size < 1024*1024*1024 else f"{size / (1024*1024*1024):.2f} GB"
-            console.print(f"  [green]✓[/green] {world}/ ({size_str}) - {description}")
+        if world in sizes:
+            console.print(f"  [green]✓[/green] {world}/ ({format_size(sizes[world])}) - {description}")
         else:
             console.print(f"  [dim]✗ {world}/ - {description}[/dim]")
 
@@ -629,6 +1618,78 @@ def show_status():
 # Mod Sync Functions
 # =============================================================================
 
+# mods/ scan results: path -> (directory mtime_ns, (all_jars, fabric_api_jars))
+_MODS_SCAN_CACHE = {}
+
+
+def is_fabric_api_jar(name):
+    """Check if a jar is Fabric API (always named fabric-api-<version>.jar)."""
+    # Only the ten-character prefix is lowercased, never the whole name
+    return name[:10].lower() == 'fabric-api'
+
+
+def _scan_mods(mods_dir):
+    """Return (all_jars, fabric_api_jars) for a mods folder in one scandir pass.
+
+    Results are cached against the folder's mtime, which changes whenever
+    a file is added, removed or renamed, so repeated checks are free.
+    """
+    try:
+        mtime = os.stat(mods_dir).st_mtime_ns
+    except FileNotFoundError:
+        return (), ()
+
+    cached = _MODS_SCAN_CACHE.get(mods_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    all_jars = []
+    fabric_api = []
+    with os.scandir(mods_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith('.jar') and entry.is_file():
+                all_jars.append(name)
+                if is_fabric_api_jar(name):
+                    fabric_api.append(name)
+
+    result = (tuple(all_jars), tuple(fabric_api))
+    _MODS_SCAN_CACHE[mods_dir] = (mtime, result)
+    return result
+
+
+def _mod_purge_targets(mods_dir):
+    """Return (jar_paths, pw_toml_paths) to delete when clearing mods (keeps Fabric API)."""
+    jars = []
+    pw_files = []
+    with os.scandir(mods_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith('.jar'):
+                if not is_fabric_api_jar(name) and entry.is_file():
+                    jars.append(entry.path)
+            elif name.endswith('.pw.toml'):
+                pw_files.append(entry.path)
+    return jars, pw_files
+
+
+def _unlink_all(paths):
+    """Delete files concurrently. Returns the paths that were locked (PermissionError)."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def unlink(path):
+        try:
+            os.unlink(path)
+            return None
+        except PermissionError:
+            return path
+
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return [path for path in pool.map(unlink, paths) if path is not None]
+
+
 def export_mrpack():
     """Export mrpack using packwiz in MCC directory"""
     packwiz_exe = os.path.join(MCC_DIR, "packwiz.exe")
@@ -664,19 +1725,65 @@ def find_latest_mrpack(auto_export=True):
     If auto_export is True and no mrpack exists, will automatically
     run packwiz modrinth export to create one.
     """
-    import glob
-    mrpacks = glob.glob(os.path.join(MCC_DIR, "MCC-*.mrpack"))
+    def newest_mrpack():
+        # Single scandir pass, one stat per match, keep the newest by mtime
+        best, best_mtime = None, -1.0
+        try:
+            with os.scandir(MCC_DIR) as it:
+                for entry in it:
+                    if entry.name.startswith('MCC-') and entry.name.endswith('.mrpack'):
+                        mtime = entry.stat().st_mtime
+                        if mtime > best_mtime:
+                            best, best_mtime = entry.path, mtime
+        except OSError:
+            return None
+        return best
+
+    mrpack = newest_mrpack()
+
+    if mrpack is None and auto_export:
+        console.print("[yellow]No mrpack found - exporting from packwiz...[/yellow]")
+        if export_mrpack():
+            mrpack = newest_mrpack()
+
+    return mrpack
+
+
+def extract_zip_member(zf, zi, dest_path, mm, raw):
+    """Extract a single zip entry to dest_path.
+
+    ZIP_STORED entries (most bundled JARs, which are already compressed) are
+    copied byte-for-byte from the archive with no inflate step: via
+    os.sendfile on Linux, otherwise from the memory-mapped archive.
+    Everything else goes through zipfile with a buffered copy.
 
-    if not mrpacks and auto_export:
-        console.print("[yellow]No mrpack found - exporting from packwiz...[/yellow]")
-        if export_mrpack():
-            mrpacks = glob.glob(os.path.join(MCC_DIR, "MCC-*.mrpack"))
+    Args:
+        zf: Open ZipFile
+        zi: ZipInfo for the entry (from infolist(), avoids a name lookup)
+        dest_path: Local file to write
+        mm: Read-only mmap of the archive file
+        raw: The archive file opened in binary mode (backs mm)
+    """
+    import zipfile
 
-    if not mrpacks:
-        return None
-    # Sort by modification time, newest first
-    mrpacks.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-    return mrpacks[0]
+    if zi.compress_type == zipfile.ZIP_STORED and not zi.flag_bits & 0x1:
+        # Skip the local file header: 30 fixed bytes + name + extra field
+        name_len, extra_len = struct.unpack_from('<HH', mm, zi.header_offset + 26)
+        data_offset = zi.header_offset + 30 + name_len + extra_len
+        with open(dest_path, 'wb') as dst:
+            if SENDFILE_TO_FILE:
+                try:
+                    _kernel_copy(raw.fileno(), dst.fileno(), data_offset, zi.file_size)
+                    return
+                except OSError:
+                    # Filesystem refused in-kernel copy - start over via mmap
+                    dst.seek(0)
+                    dst.truncate()
+            with memoryview(mm)[data_offset:data_offset + zi.file_size] as data:
+                dst.write(data)
+    else:
+        with zf.open(zi) as src, open(dest_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
 
 
 def sync_mods_from_mrpack():
@@ -687,6 +1794,7 @@ def sync_mods_from_mrpack():
     """
     import zipfile
     import json
+    import mmap
 
     mrpack_path = find_latest_mrpack(auto_export=True)
     if not mrpack_path:
@@ -697,11 +1805,12 @@ def sync_mods_from_mrpack():
     mrpack_name = os.path.basename(mrpack_path)
     console.print(f"[cyan]Syncing mods from {mrpack_name}...[/cyan]")
 
-    mods_dir = os.path.join(SCRIPT_DIR, "mods")
-    config_dir = os.path.join(SCRIPT_DIR, "config")
+    mods_dir = MODS_DIR
+    config_dir = CONFIG_DIR
 
     try:
-        with zipfile.ZipFile(mrpack_path, 'r') as zf:
+        with zipfile.ZipFile(mrpack_path, 'r') as zf, open(mrpack_path, 'rb') as raw, \
+                mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
             # Read manifest to understand structure
             manifest_data = zf.read('modrinth.index.json')
             manifest = json.loads(manifest_data)
@@ -711,15 +1820,15 @@ def sync_mods_from_mrpack():
             config_count = 0
 
             # Extract mods (from overrides/mods/)
-            for name in zf.namelist():
+            for zi in zf.infolist():
+                name = zi.filename
                 if name.startswith('overrides/mods/') and name.endswith('.jar'):
                     # Extract just the filename
                     filename = os.path.basename(name)
                     if filename:  # Skip directory entries
                         dest_path = os.path.join(mods_dir, filename)
                         os.makedirs(mods_dir, exist_ok=True)
-                        with zf.open(name) as src, open(dest_path, 'wb') as dst:
-                            dst.write(src.read())
+                        extract_zip_member(zf, zi, dest_path, mm, raw)
                         mod_count += 1
 
                 # Extract configs (from overrides/config/)
@@ -729,8 +1838,7 @@ def sync_mods_from_mrpack():
                         dest_path = os.path.join(config_dir, rel_path)
                         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
                         if not name.endswith('/'):  # Skip directories
-                            with zf.open(name) as src, open(dest_path, 'wb') as dst:
-                                dst.write(src.read())
+                            extract_zip_member(zf, zi, dest_path, mm, raw)
                             config_count += 1
 
             # Also handle files listed in manifest (downloaded mods)
@@ -782,7 +1890,9 @@ def sync_mods_full():
     """
     import zipfile
     import json
-    from rich.prompt import Confirm
+    import mmap
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 
     # Check if server is running - can't sync while mods are in use
     if is_server_running():
@@ -793,7 +1903,6 @@ def sync_mods_full():
             return False
         stop_server()
         # Wait a moment for server to release files
-        import time
         console.print("[dim]Waiting for server to stop...[/dim]")
         time.sleep(3)
 
@@ -817,8 +1926,8 @@ def sync_mods_full():
     mrpack_name = os.path.basename(mrpack_path)
     console.print(f"[cyan]Full sync from {mrpack_name}...[/cyan]")
 
-    mods_dir = os.path.join(SCRIPT_DIR, "mods")
-    config_dir = os.path.join(SCRIPT_DIR, "config")
+    mods_dir = MODS_DIR
+    config_dir = CONFIG_DIR
     os.makedirs(mods_dir, exist_ok=True)
 
     bundled_count = 0
@@ -830,31 +1939,42 @@ def sync_mods_full():
     stale_locked_count = 0
 
     try:
-        with zipfile.ZipFile(mrpack_path, 'r') as zf:
+        with zipfile.ZipFile(mrpack_path, 'r') as zf, open(mrpack_path, 'rb') as raw, \
+                mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
             # Read manifest
             manifest_data = zf.read('modrinth.index.json')
             manifest = json.loads(manifest_data)
 
-            # Build set of expected mod filenames from mrpack
-            expected_mods = set()
-
-            # From bundled overrides
-            for name in zf.namelist():
+            # Index bundled overrides in a single pass over the archive
+            bundled_mods = []     # (ZipInfo, filename)
+            bundled_configs = []  # (ZipInfo, path relative to config/)
+            for zi in zf.infolist():
+                name = zi.filename
                 if name.startswith('overrides/mods/') and name.endswith('.jar'):
                     filename = os.path.basename(name)
                     if filename:
-                        expected_mods.add(filename)
+                        bundled_mods.append((zi, filename))
+                elif name.startswith('overrides/config/') and not name.endswith('/'):
+                    rel_path = name[len('overrides/config/'):]
+                    if rel_path:
+                        bundled_configs.append((zi, rel_path))
+
+            # Mods referenced by URL, largest first so big downloads start early
+            # and small ones backfill the pool
+            mod_files = sorted(
+                (f for f in manifest.get('files', []) if f.get('path', '').startswith('mods/')),
+                key=lambda f: f.get('fileSize', 0),
+                reverse=True
+            )
 
-            # From manifest downloads
-            for file_info in manifest.get('files', []):
-                path = file_info.get('path', '')
-                if path.startswith('mods/') and path.endswith('.jar'):
-                    expected_mods.add(os.path.basename(path))
+            # Build set of expected mod filenames from mrpack
+            expected_mods = {filename for _, filename in bundled_mods}
+            expected_mods.update(os.path.basename(f['path']) for f in mod_files if f['path'].endswith('.jar'))
 
             # 0. Remove stale mods not in the mrpack
             console.print("[cyan]Checking for stale mods...[/cyan]")
             if os.path.exists(mods_dir):
-                existing_jars = [f for f in os.listdir(mods_dir) if f.endswith('.jar')]
+                existing_jars, _ = _scan_mods(mods_dir)
                 for jar in existing_jars:
                     if jar not in expected_mods:
                         jar_path = os.path.join(mods_dir, jar)
@@ -874,31 +1994,21 @@ def sync_mods_full():
                 console.print("[dim]  No stale mods found[/dim]")
 
             # 1. Extract bundled files from overrides/
-            for name in zf.namelist():
-                if name.startswith('overrides/mods/') and name.endswith('.jar'):
-                    filename = os.path.basename(name)
-                    if filename:
-                        dest_path = os.path.join(mods_dir, filename)
-                        with zf.open(name) as src, open(dest_path, 'wb') as dst:
-                            dst.write(src.read())
-                        bundled_count += 1
+            for zi, filename in bundled_mods:
+                extract_zip_member(zf, zi, os.path.join(mods_dir, filename), mm, raw)
+                bundled_count += 1
 
-                elif name.startswith('overrides/config/'):
-                    rel_path = name[len('overrides/config/'):]
-                    if rel_path and not name.endswith('/'):
-                        dest_path = os.path.join(config_dir, rel_path)
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        with zf.open(name) as src, open(dest_path, 'wb') as dst:
-                            dst.write(src.read())
-                        config_count += 1
+            for zi, rel_path in bundled_configs:
+                dest_path = os.path.join(config_dir, rel_path)
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                extract_zip_member(zf, zi, dest_path, mm, raw)
+                config_count += 1
 
             # 2. Download mods referenced in manifest
-            manifest_files = manifest.get('files', [])
-            mod_files = [f for f in manifest_files if f.get('path', '').startswith('mods/')]
-
             if mod_files:
                 console.print(f"[cyan]Downloading {len(mod_files)} mods from URLs...[/cyan]")
 
+                to_download = []
                 for mod_info in mod_files:
                     path = mod_info.get('path', '')
                     filename = os.path.basename(path)
@@ -916,14 +2026,29 @@ def sync_mods_full():
                         failed_count += 1
                         continue
 
-                    url = downloads[0]
-                    console.print(f"[dim]  Downloading {filename}...[/dim]")
-
-                    if download_mod_from_url(url, dest_path):
-                        downloaded_count += 1
-                    else:
-                        console.print(f"[red]  Failed: {filename}[/red]")
-                        failed_count += 1
+                    to_download.append((filename, downloads[0], dest_path))
+
+                # One progress bar for the batch instead of a line per mod
+                with ThreadPoolExecutor(max_workers=8) as pool, Progress(
+                    SpinnerColumn(),
+                    TextColumn("[cyan]{task.description}"),
+                    BarColumn(),
+                    TextColumn("{task.completed}/{task.total}"),
+                    console=console.resolve(),
+                    transient=True
+                ) as progress:
+                    task_id = progress.add_task("Downloading mods", total=len(to_download))
+                    futures = {
+                        pool.submit(download_mod_from_url, url, dest_path): filename
+                        for filename, url, dest_path in to_download
+                    }
+                    for future in as_completed(futures):
+                        if future.result():
+                            downloaded_count += 1
+                        else:
+                            console.print(f"[red]  Failed: {futures[future]}[/red]")
+                            failed_count += 1
+                        progress.update(task_id, advance=1)
 
             # Summary
             console.print(f"\n[green]✓ Sync complete:[/green]")
@@ -950,13 +2075,54 @@ def sync_mods_full():
 # Server Control Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def server_command(java_path):
+    """Full server start command for a Java executable, built once."""
+    return (java_path,) + JVM_FLAGS + _CMD_SUFFIX
+
+
+def write_launcher(cmd):
+    """Write the start command to LAUNCHER_FILE if it has changed.
+
+    Args:
+        cmd: Command tuple from server_command()
+
+    Returns:
+        True if LAUNCHER_FILE holds this command, False if it couldn't be written
+    """
+    if sys.platform == 'win32':
+        content = "@echo off\r\ntitle Minecraft Server\r\n" + subprocess.list2cmdline(cmd) + "\r\n"
+    else:
+        import shlex
+        content = "#!/bin/sh\nexec " + " ".join(shlex.quote(a) for a in cmd) + "\n"
+
+    path = os.path.join(SCRIPT_DIR, LAUNCHER_FILE)
+    try:
+        with open(path, 'r', newline='') as f:
+            if f.read() == content:
+                return True
+    except OSError:
+        pass
+
+    try:
+        with open(path, 'w', newline='') as f:
+            f.write(content)
+        if sys.platform != 'win32':
+            os.chmod(path, 0o755)
+        return True
+    except OSError as e:
+        console.print(f"[dim]Could not write {LAUNCHER_FILE}: {e}[/dim]")
+        return False
+
+
 def start_server():
     """Start the Minecraft server"""
     if is_server_running():
         console.print("[yellow]Server is already running![/yellow]")
         return False
 
-    # Check Java exists
+    # Check Java exists (JAVA_PATH can be overridden via env)
+    load_settings()
     if not os.path.exists(JAVA_PATH):
         console.print(f"[red]Error: Java not found at {JAVA_PATH}[/red]")
         console.print("[yellow]Set JAVA_PATH in .env or install Java 21[/yellow]")
@@ -982,32 +2148,33 @@ def start_server():
     # Sync mods from mrpack if not vanilla mode
     if not is_vanilla:
         # Check if mods are missing
-        mods_dir = os.path.join(SCRIPT_DIR, "mods")
-        existing_jars = []
-        if os.path.exists(mods_dir):
-            existing_jars = [f for f in os.listdir(mods_dir) if f.endswith('.jar')]
+        mods_dir = MODS_DIR
+        existing_jars, _ = _scan_mods(mods_dir)
 
         if len(existing_jars) < 10:  # Likely missing most mods
             console.print(f"[yellow]Only {len(existing_jars)} mod JARs found - syncing from mrpack...[/yellow]")
             if not sync_mods_full():
-                from rich.prompt import Confirm
                 if not Confirm.ask("[yellow]Start server anyway (mods may be missing)?[/yellow]", default=False):
                     return False
         else:
             console.print(f"[green]✓ {len(existing_jars)} mods already present[/green]")
 
     # Build command
-    cmd = [JAVA_PATH] + JVM_FLAGS + ["-jar", SERVER_JAR, "nogui"]
+    cmd = server_command(JAVA_PATH)
+    launcher_ready = write_launcher(cmd)
 
-    # Start server in new window
+    # Start server in new window. cmd /k keeps the window (and any crash
+    # output) open after java exits; the launcher also sets the title.
     if sys.platform == 'win32':
-        subprocess.Popen(
-            ["cmd", "/c", "start", "Minecraft Server", "cmd", "/k"] + cmd,
-            cwd=SCRIPT_DIR
-        )
+        if launcher_ready:
+            shell_cmd = ["cmd", "/k", os.path.join(SCRIPT_DIR, LAUNCHER_FILE)]
+        else:
+            shell_cmd = ["cmd", "/k"] + list(cmd)
+        subprocess.Popen(shell_cmd, cwd=SCRIPT_DIR, creationflags=subprocess.CREATE_NEW_CONSOLE)
     else:
         subprocess.Popen(cmd, cwd=SCRIPT_DIR)
 
+    forget_server_state()
     console.print("[green]✓ Server starting...[/green]")
     console.print("[dim]Server will open in a new window[/dim]")
     return True
@@ -1022,16 +2189,18 @@ def stop_server():
     console.print("[cyan]Stopping server via RCON...[/cyan]")
 
     try:
-        rcon = RCONClient(RCON_HOST, RCON_PORT, RCON_PASSWORD)
-        if rcon.connect():
-            rcon.command("stop")
-            rcon.close()
+        authenticated, _ = _rcon_command("stop")
+        # Server is shutting down - the pooled connection won't survive
+        _close_rcon()
+        forget_server_state()
+        if authenticated:
             console.print("[green]✓ Stop command sent[/green]")
             return True
         else:
             console.print("[red]RCON authentication failed[/red]")
             return False
     except Exception as e:
+        _close_rcon()
         console.print(f"[red]RCON error: {e}[/red]")
         console.print("[yellow]You may need to stop the server manually[/yellow]")
         return False
@@ -1044,15 +2213,37 @@ def send_rcon_command(cmd):
         return None
 
     try:
-        rcon = RCONClient(RCON_HOST, RCON_PORT, RCON_PASSWORD)
-        if rcon.connect():
-            response = rcon.command(cmd)
-            rcon.close()
+        authenticated, response = _rcon_command(cmd)
+        if authenticated:
             return response
         else:
             console.print("[red]RCON authentication failed[/red]")
             return None
     except Exception as e:
+        _close_rcon()
+        console.print(f"[red]RCON error: {e}[/red]")
+        return None
+
+
+def send_rcon_batch(cmds):
+    """Send a list of commands over one RCON connection, pipelined.
+
+    Returns the list of responses (None for commands with no reply),
+    or None if the server isn't reachable.
+    """
+    if not is_server_running():
+        console.print("[yellow]Server is not running[/yellow]")
+        return None
+
+    try:
+        authenticated, responses = _rcon_batch(cmds)
+        if authenticated:
+            return responses
+        else:
+            console.print("[red]RCON authentication failed[/red]")
+            return None
+    except Exception as e:
+        _close_rcon()
         console.print(f"[red]RCON error: {e}[/red]")
         return None
 
@@ -1061,35 +2252,40 @@ def send_rcon_command(cmd):
 # Mode Switching Functions
 # =============================================================================
 
+# LuckPerms settings rewritten for local auto-op: current value -> replacement
+# (kept as bytes: the config is patched without a decode/encode round trip)
+LUCKPERMS_AUTO_OP_SETTINGS = {
+    b'storage-method = "h2"': b'storage-method = "yaml"',
+    b'auto-op = false': b'auto-op = true',
+}
+LUCKPERMS_AUTO_OP_RE = re.compile(b'|'.join(re.escape(k) for k in LUCKPERMS_AUTO_OP_SETTINGS))
+
+# LuckPerms default group granting auto-op to everyone
+LUCKPERMS_DEFAULT_GROUP_YAML = b'name: default\npermissions:\n  - "luckperms.autoop"\n  - "*"\n'
+
+
 def setup_auto_op():
     """Configure LuckPerms to auto-op all players on LocalServer.
 
     This is for local testing only - makes everyone op automatically.
     """
-    lp_config = os.path.join(SCRIPT_DIR, "config", "luckperms", "luckperms.conf")
-    lp_groups = os.path.join(SCRIPT_DIR, "config", "luckperms", "yaml-storage", "groups")
+    lp_config = os.path.join(CONFIG_DIR, "luckperms", "luckperms.conf")
+    lp_groups = os.path.join(CONFIG_DIR, "luckperms", "yaml-storage", "groups")
 
     if not os.path.exists(lp_config):
         return  # LuckPerms not configured yet, will be set up on first run
 
     # Check if already configured
-    with open(lp_config, 'r') as f:
+    with open(lp_config, 'rb') as f:
         content = f.read()
 
-    changes_made = False
-
-    # Switch to YAML storage if needed
-    if 'storage-method = "h2"' in content:
-        content = content.replace('storage-method = "h2"', 'storage-method = "yaml"')
-        changes_made = True
-
-    # Enable auto-op if needed
-    if 'auto-op = false' in content:
-        content = content.replace('auto-op = false', 'auto-op = true')
-        changes_made = True
+    # Switch to YAML storage and enable auto-op in a single pass
+    content, changes_made = LUCKPERMS_AUTO_OP_RE.subn(
+        lambda m: LUCKPERMS_AUTO_OP_SETTINGS[m.group(0)], content
+    )
 
     if changes_made:
-        with open(lp_config, 'w') as f:
+        with open(lp_config, 'wb') as f:
             f.write(content)
         console.print("[green]✓ LuckPerms configured for auto-op[/green]")
 
@@ -1097,19 +2293,22 @@ def setup_auto_op():
     os.makedirs(lp_groups, exist_ok=True)
     default_group = os.path.join(lp_groups, "default.yml")
 
-    if not os.path.exists(default_group):
-        with open(default_group, 'w') as f:
-            f.write('name: default\npermissions:\n  - "luckperms.autoop"\n  - "*"\n')
+    # 'x' mode fails if the group already exists, so no separate exists() check
+    try:
+        with open(default_group, 'xb') as f:
+            f.write(LUCKPERMS_DEFAULT_GROUP_YAML)
         console.print("[green]✓ Created default group with op permissions[/green]")
+    except FileExistsError:
+        pass
 
 
 def switch_to_production_mode():
     """Switch local server to production mode"""
 
     # Check if mods are missing (e.g., coming from Vanilla mode)
-    mods_dir = os.path.join(SCRIPT_DIR, "mods")
+    mods_dir = MODS_DIR
     if os.path.exists(mods_dir):
-        jar_count = len([f for f in os.listdir(mods_dir) if f.endswith('.jar')])
+        jar_count = len(_scan_mods(mods_dir)[0])
         if jar_count < 5:
             console.print("[yellow]⚠ Warning: Only {0} mod JAR(s) found in mods/[/yellow]".format(jar_count))
             console.print("[yellow]  Mods will be restored when you start the server[/yellow]")
@@ -1129,7 +2328,7 @@ def switch_to_production_mode():
     ))
 
     # Check paths exist
-    props_production = os.path.join(SCRIPT_DIR, "server.properties.production")
+    props_production = PROPS_FILE + ".production"
     if not os.path.exists(props_production):
         console.print(f"[red]Error: {props_production} not found![/red]")
         return False
@@ -1143,55 +2342,41 @@ def switch_to_production_mode():
 
     # Step 2: Switch server.properties
     console.print("\n[bold]Step 2/5: Switching to production server.properties...[/bold]")
-    props_file = os.path.join(SCRIPT_DIR, "server.properties")
+    props_file = PROPS_FILE
     shutil.copy(props_production, props_file)
     console.print("[green]✓ server.properties updated[/green]")
 
     # Step 3: Sync configs from MCC
     console.print("\n[bold]Step 3/5: Syncing configs from MCC...[/bold]")
     mcc_config = os.path.join(MCC_DIR, "config")
-    local_config = os.path.join(SCRIPT_DIR, "config")
+    local_config = CONFIG_DIR
 
     if os.path.exists(mcc_config):
-        os.makedirs(local_config, exist_ok=True)
-        config_count = 0
-        for item in os.listdir(mcc_config):
-            src = os.path.join(mcc_config, item)
-            dst = os.path.join(local_config, item)
-            if os.path.isdir(src):
-                if os.path.exists(dst):
-                    shutil.rmtree(dst)
-                shutil.copytree(src, dst)
-            else:
-                shutil.copy2(src, dst)
-            config_count += 1
-        console.print(f"[green]✓ Synced {config_count} config items[/green]")
+        # Local-only top-level configs are kept; MCC subfolders are mirrored
+        config_count = sync_tree(mcc_config, local_config, delete_extra=False)
+        if config_count:
+            console.print(f"[green]✓ Synced {config_count} changed config file(s)[/green]")
+        else:
+            console.print("[green]✓ Configs already up to date[/green]")
     else:
         console.print("[yellow]⚠ MCC config folder not found, skipping sync[/yellow]")
 
     # Step 4: Copy backup to working directory
     console.print("\n[bold]Step 4/5: Setting up world data...[/bold]")
 
-    # World folder pairs: (backup, working)
-    world_pairs = [
-        ("world-production", "world-local"),
-        ("world-production_nether", "world-local_nether"),
-        ("world-production_the_end", "world-local_the_end"),
-    ]
-
-    backup_exists = os.path.exists(os.path.join(SCRIPT_DIR, "world-production"))
-    working_exists = os.path.exists(os.path.join(SCRIPT_DIR, "world-local"))
+    present = dirs_in(SCRIPT_DIR)
+    backup_exists = "world-production" in present
+    working_exists = "world-local" in present
 
     if backup_exists and not working_exists:
         # Copy backup to working directory
         console.print("[cyan]Copying backup to working directory...[/cyan]")
-        for backup_name, working_name in world_pairs:
-            backup_path = os.path.join(SCRIPT_DIR, backup_name)
-            working_path = os.path.join(SCRIPT_DIR, working_name)
-            if os.path.exists(backup_path):
+        jobs = []
+        for backup_name, working_name, backup_path, working_path in WORLD_PAIRS:
+            if backup_name in present:
                 console.print(f"  Copying {backup_name} → {working_name}...")
-                shutil.copytree(backup_path, working_path)
-                console.print(f"  [green]✓ {working_name}[/green]")
+                jobs.append((backup_path, working_path, f"  [green]✓ {working_name}[/green]"))
+        copy_trees_parallel(jobs)
         console.print("[green]✓ Working copy created from backup[/green]")
     elif backup_exists and working_exists:
         console.print("[green]✓ Using existing working copy (world-local)[/green]")
@@ -1221,9 +2406,9 @@ def switch_to_fresh_mode():
     """Switch local server to fresh world mode"""
 
     # Check if mods are missing (e.g., coming from Vanilla mode)
-    mods_dir = os.path.join(SCRIPT_DIR, "mods")
+    mods_dir = MODS_DIR
     if os.path.exists(mods_dir):
-        jar_count = len([f for f in os.listdir(mods_dir) if f.endswith('.jar')])
+        jar_count = len(_scan_mods(mods_dir)[0])
         if jar_count < 5:
             console.print("[yellow]⚠ Warning: Only {0} mod JAR(s) found in mods/[/yellow]".format(jar_count))
             console.print("[yellow]  Mods will be restored when you start the server[/yellow]")
@@ -1242,7 +2427,7 @@ def switch_to_fresh_mode():
     ))
 
     # Check paths exist
-    props_fresh = os.path.join(SCRIPT_DIR, "server.properties.fresh")
+    props_fresh = PROPS_FILE + ".fresh"
     if not os.path.exists(props_fresh):
         console.print(f"[red]Error: {props_fresh} not found![/red]")
         return False
@@ -1256,7 +2441,7 @@ def switch_to_fresh_mode():
 
     # Step 2: Switch server.properties
     console.print("\n[bold]Step 2/2: Switching to fresh world server.properties...[/bold]")
-    props_file = os.path.join(SCRIPT_DIR, "server.properties")
+    props_file = PROPS_FILE
     shutil.copy(props_fresh, props_file)
     console.print("[green]✓ server.properties updated[/green]")
 
@@ -1292,74 +2477,68 @@ def switch_to_vanilla_mode():
     ))
 
     # Check paths exist
-    props_vanilla = os.path.join(SCRIPT_DIR, "server.properties.vanilla")
+    props_vanilla = PROPS_FILE + ".vanilla"
     if not os.path.exists(props_vanilla):
         console.print(f"[red]Error: {props_vanilla} not found![/red]")
         return False
 
     # Switch server.properties
     console.print("\n[bold]Step 1/2: Switching to vanilla server.properties...[/bold]")
-    props_file = os.path.join(SCRIPT_DIR, "server.properties")
+    props_file = PROPS_FILE
     shutil.copy(props_vanilla, props_file)
     console.print("[green]✓ server.properties updated[/green]")
 
     # Disable packwiz-installer to prevent mods from being re-downloaded
     console.print("\n[bold]Step 2/3: Disabling packwiz-installer...[/bold]")
-    packwiz_bootstrap = os.path.join(SCRIPT_DIR, "packwiz-installer-bootstrap.jar")
+    packwiz_bootstrap = PACKWIZ_BOOTSTRAP
     packwiz_bootstrap_disabled = packwiz_bootstrap + ".disabled"
-    packwiz_json = os.path.join(SCRIPT_DIR, "packwiz.json")
+    packwiz_json = PACKWIZ_JSON
     packwiz_json_backup = packwiz_json + ".backup"
 
-    if os.path.exists(packwiz_bootstrap):
+    try:
         os.rename(packwiz_bootstrap, packwiz_bootstrap_disabled)
         console.print("[green]✓ Renamed packwiz-installer-bootstrap.jar → .disabled[/green]")
-    elif os.path.exists(packwiz_bootstrap_disabled):
-        console.print("[dim]  packwiz-installer already disabled[/dim]")
-    else:
-        console.print("[dim]  packwiz-installer-bootstrap.jar not found[/dim]")
+    except FileNotFoundError:
+        if os.path.exists(packwiz_bootstrap_disabled):
+            console.print("[dim]  packwiz-installer already disabled[/dim]")
+        else:
+            console.print("[dim]  packwiz-installer-bootstrap.jar not found[/dim]")
 
-    # Backup packwiz.json to prevent cache from being used
-    if os.path.exists(packwiz_json):
-        if os.path.exists(packwiz_json_backup):
-            os.remove(packwiz_json_backup)
-        os.rename(packwiz_json, packwiz_json_backup)
+    # Backup packwiz.json to prevent cache from being used (os.replace
+    # overwrites an old backup)
+    try:
+        os.replace(packwiz_json, packwiz_json_backup)
         console.print("[green]✓ Backed up packwiz.json[/green]")
+    except FileNotFoundError:
+        pass
 
     # Clear mods (keep only Fabric API)
     console.print("\n[bold]Step 3/3: Clearing mods (keeping Fabric API)...[/bold]")
-    mods_dir = os.path.join(SCRIPT_DIR, "mods")
+    mods_dir = MODS_DIR
     if os.path.exists(mods_dir):
-        all_jars = [f for f in os.listdir(mods_dir) if f.endswith('.jar')]
-        fabric_api = [f for f in all_jars if 'fabric-api' in f.lower()]
-        to_remove = [f for f in all_jars if f not in fabric_api]
-
-        removed = 0
-        for f in to_remove:
-            try:
-                os.remove(os.path.join(mods_dir, f))
-                removed += 1
-            except PermissionError:
-                console.print(f"\n[red]Error: Cannot delete '{f}' - file is locked![/red]")
-                console.print("\n[yellow]Something is holding this file open. Common causes:[/yellow]")
-                console.print("  • Minecraft client (Prism Launcher instance running)")
-                console.print("  • File explorer with mods folder open")
-                console.print("  • Antivirus scanning the folder")
-                console.print("  • IDE or editor with the folder indexed")
-                console.print("\n[cyan]To find the culprit on Windows:[/cyan]")
-                console.print("  1. Open Resource Monitor (resmon.exe)")
-                console.print("  2. Go to CPU tab → Associated Handles")
-                console.print("  3. Search for: LocalServer")
-                return False
+        _, fabric_api = _scan_mods(mods_dir)
+        to_remove, pw_files = _mod_purge_targets(mods_dir)
+
+        locked = _unlink_all(to_remove)
+        if locked:
+            console.print(f"\n[red]Error: Cannot delete '{os.path.basename(locked[0])}' - file is locked![/red]")
+            if len(locked) > 1:
+                console.print(f"[red]  ({len(locked) - 1} more locked file(s))[/red]")
+            console.print("\n[yellow]Something is holding this file open. Common causes:[/yellow]")
+            console.print("  • Minecraft client (Prism Launcher instance running)")
+            console.print("  • File explorer with mods folder open")
+            console.print("  • Antivirus scanning the folder")
+            console.print("  • IDE or editor with the folder indexed")
+            console.print("\n[cyan]To find the culprit on Windows:[/cyan]")
+            console.print("  1. Open Resource Monitor (resmon.exe)")
+            console.print("  2. Go to CPU tab → Associated Handles")
+            console.print("  3. Search for: LocalServer")
+            return False
 
-        # Also remove .pw.toml files
-        pw_files = [f for f in os.listdir(mods_dir) if f.endswith('.pw.toml')]
-        for f in pw_files:
-            try:
-                os.remove(os.path.join(mods_dir, f))
-            except PermissionError:
-                pass  # Not critical
+        # Also remove .pw.toml files (not critical if locked)
+        _unlink_all(pw_files)
 
-        console.print(f"[green]✓ Removed {removed} mods, kept {len(fabric_api)} Fabric API[/green]")
+        console.print(f"[green]✓ Removed {len(to_remove)} mods, kept {len(fabric_api)} Fabric API[/green]")
     else:
         console.print("[yellow]No mods folder found[/yellow]")
 
@@ -1376,9 +2555,9 @@ def switch_to_vanilla_mode():
 
 def restore_packwiz_installer():
     """Re-enable packwiz-installer if it was disabled for vanilla mode."""
-    packwiz_bootstrap = os.path.join(SCRIPT_DIR, "packwiz-installer-bootstrap.jar")
+    packwiz_bootstrap = PACKWIZ_BOOTSTRAP
     packwiz_bootstrap_disabled = packwiz_bootstrap + ".disabled"
-    packwiz_json = os.path.join(SCRIPT_DIR, "packwiz.json")
+    packwiz_json = PACKWIZ_JSON
     packwiz_json_backup = packwiz_json + ".backup"
 
     restored = False
@@ -1471,8 +2650,6 @@ def list_versions():
 
 def switch_version(target_version, auto_confirm=False):
     """Switch MCC to a specific version tag."""
-    from rich.prompt import Confirm
-
     # Validate target version exists
     tags = get_mcc_git_tags()
     if not tags:
@@ -1566,8 +2743,6 @@ def switch_version(target_version, auto_confirm=False):
 
 def return_to_main():
     """Return MCC to main branch and optionally restore stashed changes."""
-    from rich.prompt import Confirm
-
     current_version, version_type = get_mcc_current_version()
 
     # Check if already on main
@@ -1650,91 +2825,220 @@ def return_to_main():
 # World Management Functions
 # =============================================================================
 
-def get_remote_directory_info(sftp, path, exclude_dh=False):
+def get_remote_directory_info(sftp, path, exclude_dh=False, workers=SFTP_DOWNLOAD_WORKERS):
     """Calculate total size and file count of a remote directory recursively.
 
+    The same walk also records every file to download, so download_files()
+    doesn't have to list the remote tree a second time. Folders are listed
+    by several SFTP channels at once, so listing round-trips overlap
+    instead of adding up.
+
     Args:
         sftp: SFTP connection
         path: Remote path to scan
-        exclude_dh: If True, exclude DistantHorizons files from count/size
+        exclude_dh: If True, exclude DistantHorizons files from count/size/manifest
+        workers: Number of channels listing folders in parallel
+
+    Returns:
+        (file_count, total_size, dh_count, dh_size, manifest) where manifest is
+        a list of (remote_path, relative_local_path, size) tuples
     """
-    total_size = 0
-    file_count = 0
-    dh_size = 0
-    dh_count = 0
+    import queue
 
-    def scan_recursive(remote_path):
-        nonlocal total_size, file_count, dh_size, dh_count
-        try:
-            for item in sftp.listdir_attr(remote_path):
-                item_path = f"{remote_path}/{item.filename}"
-                if item.st_mode & 0o40000:
-                    scan_recursive(item_path)
-                else:
-                    if is_dh_file(item.filename):
-                        dh_size += item.st_size
-                        dh_count += 1
-                        if not exclude_dh:
-                            total_size += item.st_size
-                            file_count += 1
-                    else:
-                        total_size += item.st_size
-                        file_count += 1
-        except IOError:
-            pass
+    totals = [0, 0, 0, 0]  # file_count, total_size, dh_count, dh_size
+    manifest = []
+    totals_lock = threading.Lock()
+    errors = []
+    is_dir = stat.S_ISDIR
 
     try:
         sftp.stat(path)
-        scan_recursive(path)
     except IOError:
-        pass
+        return 0, 0, 0, 0, manifest
 
-    return file_count, total_size, dh_count, dh_size
+    def scan_worker(client):
+        while True:
+            job = pending.get()
+            if job is None:
+                return
+            try:
+                remote_dir, rel_prefix = job
+                try:
+                    items = client.listdir_attr(remote_dir)
+                except IOError:
+                    continue
+                except Exception as e:
+                    errors.append(e)  # Re-raised once the other workers stop
+                    continue
 
+                file_count = total_size = dh_count = dh_size = 0
+                files = []
+                remote_prefix = remote_dir + "/"
+                for item in items:
+                    name = item.filename
+                    item_path = remote_prefix + name
+                    rel_path = rel_prefix + name
+                    if is_dir(item.st_mode):
+                        pending.put((item_path, rel_path + os.sep))
+                        continue
 
-def download_directory_recursive(sftp, remote_path, local_path, tracker, base_path=None, exclude_dh=False):
-    """Download a remote directory recursively to local path with progress tracking.
+                    size = item.st_size
+                    if is_dh_file(name):
+                        dh_size += size
+                        dh_count += 1
+                        if exclude_dh:
+                            continue
+                    total_size += size
+                    file_count += 1
+                    files.append((item_path, rel_path, size))
+
+                with totals_lock:
+                    totals[0] += file_count
+                    totals[1] += total_size
+                    totals[2] += dh_count
+                    totals[3] += dh_size
+                    manifest.extend(files)
+            finally:
+                pending.task_done()
+
+    # Queue of (remote_dir, relative_local_prefix) still to list
+    pending = queue.Queue()
+    pending.put((path, ""))
+    extra_count = max(0, min(workers, SFTP_MAX_SESSIONS - 1) - 1)
+    clients = acquire_sftp_channels(sftp.get_channel().get_transport(), extra_count)
+    threads = [threading.Thread(target=scan_worker, args=(c,), daemon=True) for c in [sftp] + clients]
+    for thread in threads:
+        thread.start()
+    pending.join()
+    for thread in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+    release_sftp_channels(clients)
+    if errors:
+        raise errors[0]
+
+    return totals[0], totals[1], totals[2], totals[3], manifest
+
+
+def iter_remote_files(sftp, path, exclude_dh=False):
+    """Walk a remote directory, yielding files as each folder is listed.
+
+    Same walk as get_remote_directory_info(), but lazy: download_files()
+    can start on the first files while the rest of the tree is still
+    being listed.
 
     Args:
         sftp: SFTP connection
-        remote_path: Remote directory to download
-        local_path: Local directory to save to
-        tracker: Progress tracker instance
-        base_path: Base path for relative path calculation
+        path: Remote path to walk
         exclude_dh: If True, skip DistantHorizons files
+
+    Yields:
+        (remote_path, relative_local_path, size) tuples
     """
-    if base_path is None:
-        base_path = local_path
+    from collections import deque
 
-    os.makedirs(local_path, exist_ok=True)
+    is_dir = stat.S_ISDIR
 
-    try:
-        for item in sftp.listdir_attr(remote_path):
-            remote_item = f"{remote_path}/{item.filename}"
-            local_item = os.path.join(local_path, item.filename)
+    pending = deque([(path, "")])
+    while pending:
+        remote_dir, rel_prefix = pending.popleft()
+        try:
+            items = sftp.listdir_attr(remote_dir)
+        except IOError:
+            continue
 
-            if item.st_mode & 0o40000:
-                download_directory_recursive(sftp, remote_item, local_item, tracker, base_path, exclude_dh)
-            else:
-                # Skip DH files if requested
-                if exclude_dh and is_dh_file(item.filename):
-                    continue
+        remote_prefix = remote_dir + "/"
+        for item in items:
+            name = item.filename
+            if is_dir(item.st_mode):
+                pending.append((remote_prefix + name, rel_prefix + name + os.sep))
+            elif not (exclude_dh and is_dh_file(name)):
+                yield remote_prefix + name, rel_prefix + name, item.st_size
 
-                try:
-                    rel_path = os.path.relpath(local_item, base_path)
-                    tracker.start_file(rel_path, item.st_size)
-                    sftp.get(remote_item, local_item, callback=progress_callback(tracker))
-                    tracker.file_complete(success=True)
-                except Exception as e:
-                    tracker.file_complete(success=False)
-                    console.print(f"[red]Error downloading {item.filename}: {e}[/red]")
-    except IOError as e:
-        console.print(f"[red]Error accessing {remote_path}: {e}[/red]")
+
+def download_files(sftp, manifest, local_path, tracker, workers=SFTP_DOWNLOAD_WORKERS):
+    """Download the files listed in a manifest from get_remote_directory_info.
+
+    A pool of extra SFTP channels (on the same SSH transport, so no new
+    logins) downloads files concurrently so per-file round-trips overlap.
+    The channels are kept for the next download in the run. Local
+    directories are created as needed.
+
+    Args:
+        sftp: SFTP connection
+        manifest: List of (remote_path, relative_local_path, size) tuples,
+            or a lazy iterator of them from iter_remote_files()
+        local_path: Local directory to save to
+        tracker: Progress tracker instance
+        workers: Number of parallel SFTP channels to open
+    """
+    import queue
+
+    os.makedirs(local_path, exist_ok=True)
+    created_dirs = {local_path}
+    dirs_lock = threading.Lock()
+
+    def download_worker(client):
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            remote_item, rel_path, size = job
+            local_item = os.path.join(local_path, rel_path)
+            local_dir = os.path.dirname(local_item)
+            try:
+                with dirs_lock:
+                    if local_dir not in created_dirs:
+                        os.makedirs(local_dir, exist_ok=True)
+                        created_dirs.add(local_dir)
+                tracker.start_file(rel_path, size)
+                sftp_fetch(client, remote_item, local_item, size, progress_callback(tracker, size))
+                tracker.file_complete(success=True)
+            except Exception as e:
+                tracker.file_complete(success=False)
+                console.print(f"[red]Error downloading {os.path.basename(rel_path)}: {e}[/red]")
+
+    jobs = queue.Queue()
+    # Stay under MaxSessions: `sftp` itself holds one channel
+    worker_count = max(1, min(workers, SFTP_MAX_SESSIONS - 1))
+    if isinstance(manifest, list):
+        worker_count = min(worker_count, len(manifest))
+
+    # Extra channels for the workers
+    clients = acquire_sftp_channels(sftp.get_channel().get_transport(), worker_count)
+
+    if not clients:
+        # No extra channels available: download on the given connection
+        for job in manifest:
+            jobs.put(job)
+        jobs.put(None)
+        download_worker(sftp)
+        return
+
+    threads = [threading.Thread(target=download_worker, args=(c,), daemon=True) for c in clients]
+    for thread in threads:
+        thread.start()
+    # A lazy manifest keeps listing on `sftp` while the workers download
+    for job in manifest:
+        jobs.put(job)
+    for thread in threads:
+        jobs.put(None)
+    for thread in threads:
+        thread.join()
+    release_sftp_channels(clients)
 
 
 def backup_local_world(world_dirs):
-    """Backup existing local world directories before overwriting."""
-    existing_dirs = [d for d in world_dirs if os.path.exists(d)]
+    """Move existing local world directories aside before they are overwritten.
+
+    The backup folder sits next to the worlds, so each one is normally
+    moved with a single rename; a copy is only made if the rename fails
+    (e.g. a file is locked). Moved folders no longer exist afterwards.
+    world_dirs are paths of folders in SCRIPT_DIR.
+    """
+    present = dirs_in(SCRIPT_DIR)
+    existing_dirs = [d for d in world_dirs if os.path.basename(d) in present]
     if not existing_dirs:
         return None
 
@@ -1742,27 +3046,33 @@ def backup_local_world(world_dirs):
     backup_base = os.path.join(SCRIPT_DIR, f"world-backup-{timestamp}")
     os.makedirs(backup_base, exist_ok=True)
 
+    jobs = []
     for world_dir in existing_dirs:
         dir_name = os.path.basename(world_dir)
         backup_dest = os.path.join(backup_base, dir_name)
         console.print(f"[cyan]Backing up {dir_name}...[/cyan]")
-        shutil.copytree(world_dir, backup_dest)
-        console.print(f"[green]✓ Backed up {dir_name}[/green]")
+        try:
+            os.rename(world_dir, backup_dest)
+            console.print(f"[green]✓ Backed up {dir_name}[/green]")
+        except OSError:
+            jobs.append((world_dir, backup_dest, f"[green]✓ Backed up {dir_name}[/green]"))
+    copy_trees_parallel(jobs)
 
     return backup_base
 
 
-def download_world(backup_existing=True, auto_confirm=False, include_dh=False):
+def download_world(backup_existing=True, auto_confirm=False, include_dh=False, scan_first=True,
+                   workers=SFTP_DOWNLOAD_WORKERS):
     """Download world data from production server.
 
     Args:
         backup_existing: Backup existing local world before download
         auto_confirm: Skip confirmation prompts
         include_dh: If True, include DistantHorizons files (default: exclude)
+        scan_first: Size the remote folders before downloading. When False,
+            files are downloaded while the tree is listed (no totals/ETA)
+        workers: Number of parallel SFTP channels (the server may allow fewer)
     """
-    import time
-    from rich.prompt import Confirm
-
     WORLD_FOLDERS = [
         ("/world", "world-production"),
         ("/world_nether", "world-production_nether"),
@@ -1783,12 +3093,13 @@ def download_world(backup_existing=True, auto_confirm=False, include_dh=False):
 
     console.print(f"\n[cyan]Connecting to {SFTP_HOST}:{SFTP_PORT}...[/cyan]")
 
-    ssh, sftp = get_sftp_connection()
+    _, sftp = get_sftp_connection()
     if not sftp:
         return False
 
     console.print("[green]Connected![/green]")
-    console.print("\n[cyan]Scanning remote world folders...[/cyan]")
+    if scan_first:
+        console.print("\n[cyan]Scanning remote world folders...[/cyan]")
 
     folder_info = []
     total_files = 0
@@ -1797,22 +3108,37 @@ def download_world(backup_existing=True, auto_confirm=False, include_dh=False):
     total_dh_size = 0
 
     for remote_path, local_name in WORLD_FOLDERS:
-        file_count, size, dh_count, dh_size = get_remote_directory_info(
-            sftp, remote_path, exclude_dh=not include_dh
+        if not scan_first:
+            try:
+                sftp.stat(remote_path)
+            except IOError:
+                console.print(f"[dim]  {remote_path} (not found, skipping)[/dim]")
+                continue
+            folder_info.append({
+                'remote': remote_path,
+                'local': local_name,
+                'local_path': os.path.join(SCRIPT_DIR, local_name),
+                'manifest': iter_remote_files(sftp, remote_path, exclude_dh=not include_dh)
+            })
+            continue
+
+        file_count, size, dh_count, dh_size, manifest = get_remote_directory_info(
+            sftp, remote_path, exclude_dh=not include_dh, workers=workers
         )
+        # file_count/size already include or exclude DH per exclude_dh
         if file_count > 0 or (include_dh and dh_count > 0):
-            actual_files = file_count if include_dh else file_count
-            actual_size = size if include_dh else size
             folder_info.append({
                 'remote': remote_path,
                 'local': local_name,
-                'files': actual_files,
-                'size': actual_size,
+                'local_path': os.path.join(SCRIPT_DIR, local_name),
+                'files': file_count,
+                'size': size,
                 'dh_files': dh_count,
-                'dh_size': dh_size
+                'dh_size': dh_size,
+                'manifest': manifest
             })
-            total_files += actual_files
-            total_size += actual_size
+            total_files += file_count
+            total_size += size
             total_dh_files += dh_count
             total_dh_size += dh_size
         else:
@@ -1821,45 +3147,45 @@ def download_world(backup_existing=True, auto_confirm=False, include_dh=False):
     if not folder_info:
         console.print("[red]No world folders found on remote server![/red]")
         sftp.close()
-        ssh.close()
         return False
 
-    # Build table
-    table = Table(title="Remote World Folders", box=box.ROUNDED)
-    table.add_column("Folder", style="cyan")
-    table.add_column("Files", style="white", justify="right")
-    table.add_column("Size", style="green", justify="right")
-    if not include_dh and total_dh_files > 0:
-        table.add_column("DH (excluded)", style="dim", justify="right")
-
-    for info in folder_info:
-        row = [info['remote'], str(info['files']), format_size(info['size'])]
+    if scan_first:
+        # Build table
+        table = Table(title="Remote World Folders", box=box.ROUNDED)
+        table.add_column("Folder", style="cyan")
+        table.add_column("Files", style="white", justify="right")
+        table.add_column("Size", style="green", justify="right")
         if not include_dh and total_dh_files > 0:
-            if info['dh_files'] > 0:
-                row.append(f"{info['dh_files']} ({format_size(info['dh_size'])})")
-            else:
-                row.append("-")
-        table.add_row(*row)
+            table.add_column("DH (excluded)", style="dim", justify="right")
 
-    # Totals row
-    if not include_dh and total_dh_files > 0:
-        table.add_row("", "", "", "", style="dim")
-        table.add_row(
-            "[bold]Total[/bold]",
-            f"[bold]{total_files}[/bold]",
-            f"[bold]{format_size(total_size)}[/bold]",
-            f"[dim]{total_dh_files} ({format_size(total_dh_size)})[/dim]"
-        )
-    else:
-        table.add_row("", "", "", style="dim")
-        table.add_row("[bold]Total[/bold]", f"[bold]{total_files}[/bold]", f"[bold]{format_size(total_size)}[/bold]")
+        for info in folder_info:
+            row = [info['remote'], str(info['files']), format_size(info['size'])]
+            if not include_dh and total_dh_files > 0:
+                if info['dh_files'] > 0:
+                    row.append(f"{info['dh_files']} ({format_size(info['dh_size'])})")
+                else:
+                    row.append("-")
+            table.add_row(*row)
 
-    console.print()
-    console.print(table)
+        # Totals row
+        if not include_dh and total_dh_files > 0:
+            table.add_row("", "", "", "", style="dim")
+            table.add_row(
+                "[bold]Total[/bold]",
+                f"[bold]{total_files}[/bold]",
+                f"[bold]{format_size(total_size)}[/bold]",
+                f"[dim]{total_dh_files} ({format_size(total_dh_size)})[/dim]"
+            )
+        else:
+            table.add_row("", "", "", style="dim")
+            table.add_row("[bold]Total[/bold]", f"[bold]{total_files}[/bold]", f"[bold]{format_size(total_size)}[/bold]")
+
+        console.print()
+        console.print(table)
 
-    if not include_dh and total_dh_size > 0:
-        console.print(f"\n[yellow]ℹ {format_size(total_dh_size)} of DistantHorizons data excluded[/yellow]")
-        console.print("[dim]  Use 'Download DistantHorizons' for cold storage backup[/dim]")
+        if not include_dh and total_dh_size > 0:
+            console.print(f"\n[yellow]ℹ {format_size(total_dh_size)} of DistantHorizons data excluded[/yellow]")
+            console.print("[dim]  Use 'Download DistantHorizons' for cold storage backup[/dim]")
 
     # Check for local server running
     session_lock = os.path.join(SCRIPT_DIR, "world-production", "session.lock")
@@ -1868,47 +3194,56 @@ def download_world(backup_existing=True, auto_confirm=False, include_dh=False):
         if not auto_confirm and not Confirm.ask("Continue anyway?"):
             console.print("[yellow]Cancelled.[/yellow]")
             sftp.close()
-            ssh.close()
             return False
 
     if not auto_confirm:
         console.print()
-        if not Confirm.ask(f"Download {format_size(total_size)} from production server?"):
+        amount = format_size(total_size) if scan_first else "world data"
+        if not Confirm.ask(f"Download {amount} from production server?"):
             console.print("[yellow]Cancelled.[/yellow]")
             sftp.close()
-            ssh.close()
             return False
 
+    # One listing answers every "does this local folder exist" below
+    present = dirs_in(SCRIPT_DIR)
+
     # Backup existing local world
     if backup_existing:
-        local_world_dirs = [os.path.join(SCRIPT_DIR, info['local']) for info in folder_info]
-        existing_dirs = [d for d in local_world_dirs if os.path.exists(d)]
+        existing_dirs = [info['local_path'] for info in folder_info if info['local'] in present]
         if existing_dirs:
             console.print("\n[bold]Backing up existing world...[/bold]")
-            backup_path = backup_local_world(local_world_dirs)
+            backup_path = backup_local_world(existing_dirs)
             if backup_path:
                 console.print(f"[green]✓ Backup saved to: {os.path.basename(backup_path)}/[/green]")
+            # Backed-up folders were moved, not copied
+            present = dirs_in(SCRIPT_DIR)
 
     # Download each folder
     console.print("\n[bold]Downloading world data...[/bold]\n")
     start_time = time.time()
 
+    # Old folders are deleted in the background while the download runs
+    deleters = []
     with RichProgressTracker(total_files=total_files, total_size=total_size) as tracker:
         for info in folder_info:
-            local_path = os.path.join(SCRIPT_DIR, info['local'])
+            local_path = info['local_path']
 
-            if os.path.exists(local_path):
-                shutil.rmtree(local_path)
+            if info['local'] in present:
+                deleter = rmtree_in_background(local_path)
+                if deleter is not None:
+                    deleters.append(deleter)
 
             console.print(f"[cyan]Downloading {info['remote']}...[/cyan]")
-            download_directory_recursive(
-                sftp, info['remote'], local_path, tracker,
-                exclude_dh=not include_dh
-            )
+            download_files(sftp, info['manifest'], local_path, tracker, workers)
+    for deleter in deleters:
+        deleter.join()
+
+    if not scan_first:
+        total_files = tracker.files_succeeded + tracker.files_failed
+        total_size = tracker.total_bytes_transferred
 
     elapsed = time.time() - start_time
     sftp.close()
-    ssh.close()
 
     console.print("\n" + "="*50)
     console.print("[bold green]✓ World download complete![/bold green]")
@@ -1925,9 +3260,6 @@ def download_distant_horizons(auto_confirm=False):
     This downloads only the DH SQLite files to a separate cold storage
     directory. These files are large and rarely need updating.
     """
-    import time
-    from rich.prompt import Confirm
-
     # DH file locations within world folders
     DH_LOCATIONS = [
         ("/world/data", "overworld"),
@@ -1949,7 +3281,7 @@ def download_distant_horizons(auto_confirm=False):
 
     console.print(f"\n[cyan]Connecting to {SFTP_HOST}:{SFTP_PORT}...[/cyan]")
 
-    ssh, sftp = get_sftp_connection()
+    _, sftp = get_sftp_connection()
     if not sftp:
         return False
 
@@ -1962,10 +3294,11 @@ def download_distant_horizons(auto_confirm=False):
 
     for remote_dir, dim_name in DH_LOCATIONS:
         try:
+            remote_prefix = remote_dir + "/"
             for item in sftp.listdir_attr(remote_dir):
                 if is_dh_file(item.filename):
                     dh_files.append({
-                        'remote': f"{remote_dir}/{item.filename}",
+                        'remote': remote_prefix + item.filename,
                         'local_dir': dim_name,
                         'filename': item.filename,
                         'size': item.st_size
@@ -1977,7 +3310,6 @@ def download_distant_horizons(auto_confirm=False):
     if not dh_files:
         console.print("[yellow]No DistantHorizons files found on server[/yellow]")
         sftp.close()
-        ssh.close()
         return False
 
     # Display found files
@@ -2000,7 +3332,6 @@ def download_distant_horizons(auto_confirm=False):
         if not Confirm.ask(f"Download {format_size(total_size)} to cold storage?"):
             console.print("[yellow]Cancelled.[/yellow]")
             sftp.close()
-            ssh.close()
             return False
 
     # Create cold storage directory
@@ -2019,7 +3350,7 @@ def download_distant_horizons(auto_confirm=False):
             tracker.start_file(f"{df['local_dir']}/{df['filename']}", df['size'])
 
             try:
-                sftp.get(df['remote'], local_path, callback=progress_callback(tracker))
+                sftp_fetch(sftp, df['remote'], local_path, df['size'], progress_callback(tracker))
                 tracker.file_complete(success=True)
             except Exception as e:
                 tracker.file_complete(success=False)
@@ -2027,7 +3358,6 @@ def download_distant_horizons(auto_confirm=False):
 
     elapsed = time.time() - start_time
     sftp.close()
-    ssh.close()
 
     console.print("\n" + "="*50)
     console.print("[bold green]✓ DistantHorizons download complete![/bold green]")
@@ -2052,29 +3382,43 @@ def upload_directory_recursive(sftp, local_path, remote_path, tracker, base_path
     """
     if base_path is None:
         base_path = local_path
+    # Relative paths are a plain prefix strip (os.path.relpath normalizes both sides per file)
+    base_prefix = os.path.join(base_path, "")
 
-    # Create remote directory
-    try:
-        sftp.stat(remote_path)
-    except IOError:
-        sftp.mkdir(remote_path)
+    # Iterative walk: (local_dir, remote_dir); a directory is always
+    # created remotely before anything inside it is popped
+    pending = [(local_path, remote_path)]
+    while pending:
+        local_dir, remote_dir = pending.pop()
+
+        # Create remote directory
+        try:
+            sftp.stat(remote_dir)
+        except IOError:
+            sftp.mkdir(remote_dir)
 
-    for item in os.listdir(local_path):
-        local_item = os.path.join(local_path, item)
-        remote_item = f"{remote_path}/{item}"
+        with os.scandir(local_dir) as it:
+            entries = list(it)
+
+        remote_prefix = remote_dir + "/"
+        for entry in entries:
+            item = entry.name
+            local_item = entry.path
+            remote_item = remote_prefix + item
+
+            if entry.is_dir():
+                pending.append((local_item, remote_item))
+                continue
 
-        if os.path.isdir(local_item):
-            upload_directory_recursive(sftp, local_item, remote_item, tracker, base_path, exclude_dh)
-        else:
             # Skip DH files if requested
             if exclude_dh and is_dh_file(item):
                 continue
 
             try:
-                file_size = os.path.getsize(local_item)
-                rel_path = os.path.relpath(local_item, base_path)
+                file_size = entry.stat().st_size
+                rel_path = local_item[len(base_prefix):]
                 tracker.start_file(rel_path, file_size)
-                sftp.put(local_item, remote_item, callback=progress_callback(tracker))
+                sftp.put(local_item, remote_item, callback=progress_callback(tracker, file_size))
                 tracker.file_complete(success=True)
             except Exception as e:
                 tracker.file_complete(success=False)
@@ -2088,12 +3432,24 @@ def get_local_directory_info(path, exclude_dh=False):
     dh_size = 0
     dh_count = 0
 
-    for dirpath, dirnames, filenames in os.walk(path):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            try:
-                file_size = os.path.getsize(filepath)
-                if is_dh_file(filename):
+    # scandir entries carry their own path and cached stat, so there's no
+    # join or extra stat per file
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    file_size = entry.stat().st_size
+                except OSError:
+                    continue
+                if is_dh_file(entry.name):
                     dh_size += file_size
                     dh_count += 1
                     if not exclude_dh:
@@ -2102,8 +3458,6 @@ def get_local_directory_info(path, exclude_dh=False):
                 else:
                     total_size += file_size
                     file_count += 1
-            except OSError:
-                pass
 
     return file_count, total_size, dh_count, dh_size
 
@@ -2114,9 +3468,6 @@ def upload_world(auto_confirm=False):
     This uploads world-production folders back to the production server.
     Requires server to be offline.
     """
-    import time
-    from rich.prompt import Confirm
-
     WORLD_FOLDERS = [
         ("world-production", "/world"),
         ("world-production_nether", "/world_nether"),
@@ -2217,7 +3568,7 @@ def upload_world(auto_confirm=False):
 
     console.print(f"\n[cyan]Connecting to {SFTP_HOST}:{SFTP_PORT}...[/cyan]")
 
-    ssh, sftp = get_sftp_connection()
+    _, sftp = get_sftp_connection()
     if not sftp:
         return False
 
@@ -2238,9 +3589,10 @@ def upload_world(auto_confirm=False):
                 # Remove existing files in remote (but not the directory itself)
                 def clear_remote_dir(remote_dir):
                     try:
+                        remote_prefix = remote_dir + "/"
                         for item in sftp.listdir_attr(remote_dir):
-                            item_path = f"{remote_dir}/{item.filename}"
-                            if item.st_mode & 0o40000:
+                            item_path = remote_prefix + item.filename
+                            if stat.S_ISDIR(item.st_mode):
                                 clear_remote_dir(item_path)
                                 sftp.rmdir(item_path)
                             else:
@@ -2259,7 +3611,6 @@ def upload_world(auto_confirm=False):
 
     elapsed = time.time() - start_time
     sftp.close()
-    ssh.close()
 
     console.print("\n" + "="*50)
     console.print("[bold green]✓ World upload complete![/bold green]")
@@ -2277,9 +3628,6 @@ def upload_distant_horizons(auto_confirm=False):
     This can be done while the server is online - DH files are not
     a hard dependency for server startup.
     """
-    import time
-    from rich.prompt import Confirm
-
     # DH file destinations within world folders
     DH_DESTINATIONS = [
         ("overworld", "/world/data"),
@@ -2312,15 +3660,18 @@ def upload_distant_horizons(auto_confirm=False):
 
     for dim_name, remote_dir in DH_DESTINATIONS:
         dim_path = os.path.join(cold_storage_path, dim_name)
-        if os.path.exists(dim_path):
-            for filename in os.listdir(dim_path):
-                if is_dh_file(filename):
-                    filepath = os.path.join(dim_path, filename)
-                    file_size = os.path.getsize(filepath)
+        try:
+            it = os.scandir(dim_path)
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if is_dh_file(entry.name):
+                    file_size = entry.stat().st_size
                     dh_files.append({
-                        'local': filepath,
+                        'local': entry.path,
                         'remote_dir': remote_dir,
-                        'filename': filename,
+                        'filename': entry.name,
                         'dim': dim_name,
                         'size': file_size
                     })
@@ -2353,7 +3704,7 @@ def upload_distant_horizons(auto_confirm=False):
 
     console.print(f"\n[cyan]Connecting to {SFTP_HOST}:{SFTP_PORT}...[/cyan]")
 
-    ssh, sftp = get_sftp_connection()
+    _, sftp = get_sftp_connection()
     if not sftp:
         return False
 
@@ -2391,7 +3742,6 @@ def upload_distant_horizons(auto_confirm=False):
 
     elapsed = time.time() - start_time
     sftp.close()
-    ssh.close()
 
     console.print("\n" + "="*50)
     console.print("[bold green]✓ DistantHorizons upload complete![/bold green]")
@@ -2404,8 +3754,6 @@ def upload_distant_horizons(auto_confirm=False):
 
 def reset_world(mode):
     """Delete world folders for specified mode"""
-    from rich.prompt import Confirm
-
     world_map = {
         "fresh": ["world-fresh", "world-fresh_nether", "world-fresh_the_end"],
         "vanilla": ["world-vanilla", "world-vanilla_nether", "world-vanilla_the_end"],
@@ -2419,7 +3767,8 @@ def reset_world(mode):
         return False
 
     world_dirs = world_map[mode]
-    existing = [d for d in world_dirs if os.path.exists(os.path.join(SCRIPT_DIR, d))]
+    present = dirs_in(SCRIPT_DIR)
+    existing = [d for d in world_dirs if d in present]
 
     if not existing:
         console.print(f"[yellow]No {mode} world folders found[/yellow]")
@@ -2440,48 +3789,44 @@ def reset_world(mode):
     for d in existing:
         path = os.path.join(SCRIPT_DIR, d)
         console.print(f"[cyan]Deleting {d}...[/cyan]")
-        shutil.rmtree(path)
+        fast_rmtree(path)
         console.print(f"[green]✓ Deleted {d}[/green]")
 
     console.print(f"\n[green]✓ {mode.capitalize()} world reset complete[/green]")
     return True
 
 
-def reset_local_world():
-    """Reset world-local by copying fresh from world-production backup"""
-    from rich.prompt import Confirm
+def reset_local_world(force_clean=False):
+    """Reset world-local from the world-production backup.
 
-    # World folder pairs: (backup, working)
-    world_pairs = [
-        ("world-production", "world-local"),
-        ("world-production_nether", "world-local_nether"),
-        ("world-production_the_end", "world-local_the_end"),
-    ]
+    By default the working folders are mirrored from the backup, so only
+    files that changed since the last reset are rewritten.
 
-    backup_path = os.path.join(SCRIPT_DIR, "world-production")
-    working_path = os.path.join(SCRIPT_DIR, "world-local")
+    Args:
+        force_clean: Delete the working folders and copy the backup in full
+    """
+    present = dirs_in(SCRIPT_DIR)
 
-    if not os.path.exists(backup_path):
+    if "world-production" not in present:
         console.print("[red]Error: No backup found (world-production)[/red]")
         console.print("[dim]Run 'world-download' from MCC first to get production backup.[/dim]")
         return False
 
     # Check what exists
-    existing_working = [name for _, name in world_pairs
-                        if os.path.exists(os.path.join(SCRIPT_DIR, name))]
+    existing_working = [name for _, name, _, _ in WORLD_PAIRS if name in present]
 
     console.print(Panel(
         "[bold yellow]Reset Local World[/bold yellow]\n\n"
         "This will:\n"
-        "  1. Delete current world-local folders\n"
-        "  2. Copy fresh data from world-production backup\n\n"
+        "  1. Discard all changes in the world-local folders\n"
+        "  2. Restore them from the world-production backup\n\n"
         "[dim]The backup (world-production) will NOT be modified.[/dim]",
         title="[yellow]⚠ Reset Working Copy[/yellow]",
         border_style="yellow"
     ))
 
     if existing_working:
-        console.print("\n[yellow]Will be deleted:[/yellow]")
+        console.print("\n[yellow]Will be overwritten:[/yellow]")
         for name in existing_working:
             console.print(f"  • {name}/")
 
@@ -2489,22 +3834,21 @@ def reset_local_world():
         console.print("[dim]Cancelled.[/dim]")
         return False
 
-    # Delete existing working folders
-    for _, working_name in world_pairs:
-        working = os.path.join(SCRIPT_DIR, working_name)
-        if os.path.exists(working):
+    # Delete working folders that are being rebuilt from scratch, or that
+    # have no backup counterpart to mirror
+    for backup_name, working_name, _, working in WORLD_PAIRS:
+        if working_name in present and (force_clean or backup_name not in present):
             console.print(f"[cyan]Deleting {working_name}...[/cyan]")
-            shutil.rmtree(working)
+            fast_rmtree(working)
 
-    # Copy from backup
+    # Copy from backup (only changed files unless force_clean)
     console.print("\n[cyan]Copying from backup...[/cyan]")
-    for backup_name, working_name in world_pairs:
-        backup = os.path.join(SCRIPT_DIR, backup_name)
-        working = os.path.join(SCRIPT_DIR, working_name)
-        if os.path.exists(backup):
+    jobs = []
+    for backup_name, working_name, backup, working in WORLD_PAIRS:
+        if backup_name in present:
             console.print(f"  {backup_name} → {working_name}...")
-            shutil.copytree(backup, working)
-            console.print(f"  [green]✓ {working_name}[/green]")
+            jobs.append((backup, working, f"  [green]✓ {working_name}[/green]"))
+    copy_trees_parallel(jobs, copy=fast_copytree if force_clean else mirror_tree)
 
     console.print("\n[green]✓ Local world reset from backup[/green]")
     return True
@@ -2547,19 +3891,17 @@ def grant_permissions(username):
 
 def clear_mods():
     """Remove all mods except Fabric API"""
-    from rich.prompt import Confirm
-
-    mods_dir = os.path.join(SCRIPT_DIR, "mods")
+    mods_dir = MODS_DIR
     if not os.path.exists(mods_dir):
         console.print("[yellow]No mods folder found[/yellow]")
         return True
 
     # Count mods
-    all_jars = [f for f in os.listdir(mods_dir) if f.endswith('.jar')]
-    fabric_api = [f for f in all_jars if 'fabric-api' in f.lower()]
-    to_remove = [f for f in all_jars if f not in fabric_api]
+    # fabric_api is a subset of all_jars, so no per-jar membership test
+    all_jars, fabric_api = _scan_mods(mods_dir)
+    remove_count = len(all_jars) - len(fabric_api)
 
-    if not to_remove:
+    if not remove_count:
         console.print("[green]Only Fabric API found, nothing to remove[/green]")
         return True
 
@@ -2567,7 +3909,7 @@ def clear_mods():
         f"[bold]Clear Mods[/bold]\n\n"
         f"Found {len(all_jars)} mod JARs\n"
         f"  • Keeping: {len(fabric_api)} (Fabric API)\n"
-        f"  • Removing: {len(to_remove)} mods",
+        f"  • Removing: {remove_count} mods",
         title="[cyan]Mod Cleanup[/cyan]",
         border_style="cyan"
     ))
@@ -2576,15 +3918,16 @@ def clear_mods():
         console.print("[yellow]Cancelled.[/yellow]")
         return False
 
-    for f in to_remove:
-        os.remove(os.path.join(mods_dir, f))
-
-    # Also remove .pw.toml files
-    pw_files = [f for f in os.listdir(mods_dir) if f.endswith('.pw.toml')]
-    for f in pw_files:
-        os.remove(os.path.join(mods_dir, f))
+    # Also removes .pw.toml files
+    jar_paths, pw_files = _mod_purge_targets(mods_dir)
+    locked = _unlink_all(jar_paths + pw_files)
+    if locked:
+        console.print(f"[red]Error: {len(locked)} file(s) locked and not removed:[/red]")
+        for path in locked:
+            console.print(f"  [red]• {os.path.basename(path)}[/red]")
+        return False
 
-    console.print(f"[green]✓ Removed {len(to_remove)} mods and {len(pw_files)} .pw.toml files[/green]")
+    console.print(f"[green]✓ Removed {len(jar_paths)} mods and {len(pw_files)} .pw.toml files[/green]")
     return True
 
 
@@ -2592,28 +3935,79 @@ def clear_mods():
 # Interactive Menu
 # =============================================================================
 
+# Interactive menu layout: (key, label); blank keys are spacers/headings
+MENU_ROWS = (
+    ("1", "Start Server"),
+    ("2", "Stop Server (RCON)"),
+    ("", ""),
+    ("", "[dim]── Server Mode ──[/dim]"),
+    ("p", "[cyan]Production Mode[/cyan] (copy of backup, all mods)"),
+    ("f", "[green]Fresh World Mode[/green] (new world, all mods)"),
+    ("v", "[yellow]Vanilla Debug Mode[/yellow] (new world, Fabric only)"),
+    ("", ""),
+    ("", "[dim]── World Sync (Production ↔ Local) ──[/dim]"),
+    ("d", "Download World Data [dim](excludes DistantHorizons)[/dim]"),
+    ("D", "Download World + DH [dim](full download, rare)[/dim]"),
+    ("h", "Download DistantHorizons [dim](to cold storage)[/dim]"),
+    ("u", "[red]Upload World to Production[/red] [dim](server offline)[/dim]"),
+    ("H", "Upload DistantHorizons [dim](server can be online)[/dim]"),
+    ("", ""),
+    ("", "[dim]── Local World Management ──[/dim]"),
+    ("4", "Reset Local World (from backup)"),
+    ("5", "Delete Fresh World"),
+    ("6", "Delete Vanilla World"),
+    ("", ""),
+    ("", "[dim]── Modpack Version ──[/dim]"),
+    ("l", "List Versions"),
+    ("c", "Change Version"),
+    ("b", "Back to Main Branch"),
+    ("", ""),
+    ("", "[dim]── Utilities ──[/dim]"),
+    ("m", "Sync Mods (from mrpack)"),
+    ("o", "Grant Permissions (op via LuckPerms)"),
+    ("r", "Send RCON Command"),
+    ("s", "Show Status"),
+    ("", ""),
+    ("q", "Quit"),
+)
+MENU_CHOICES = ["1", "2", "d", "D", "h", "u", "H", "4", "5", "6", "p", "f", "v", "l", "c", "b", "m", "o", "r", "s", "q"]
+
+
+@functools.lru_cache(maxsize=None)
+def _menu_renderables():
+    """Build the menu's static header and option table once per session.
+
+    Rich renderables can be printed repeatedly, so redraws reuse these
+    instead of re-parsing the markup and rebuilding the table each time.
+    """
+    from rich.text import Text
+
+    header = Panel.fit(
+        "[bold cyan]LocalServer Manager[/bold cyan]\n"
+        "[dim]Local Test Server Control[/dim]",
+        border_style="cyan"
+    )
+
+    table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
+    table.add_column("Key", style="bold yellow")
+    table.add_column("Action", style="white")
+    for key, action in MENU_ROWS:
+        table.add_row(key, Text.from_markup(action))
+
+    return header, table
+
+
 def interactive_menu():
     """Show an interactive menu"""
-    from rich.prompt import Prompt
-
+    header, table = _menu_renderables()
     while True:
         console.clear()
-        console.print(Panel.fit(
-            "[bold cyan]LocalServer Manager[/bold cyan]\n"
-            "[dim]Local Test Server Control[/dim]",
-            border_style="cyan"
-        ))
+        console.print(header)
 
         # Show status
         mode = get_current_mode()
         running = is_server_running()
-        mode_colors = {
-            "production": "cyan",
-            "fresh": "green",
-            "vanilla": "yellow",
-            "unknown": "dim"
-        }
-        mode_color = mode_colors.get(mode, "dim")
+        mode_color = MODE_COLORS.get(mode, "dim")
         status_color = "green" if running else "red"
         status_text = "RUNNING" if running else "STOPPED"
 
@@ -2628,47 +4022,10 @@ def interactive_menu():
         console.print()
 
         # Menu options
-        table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
-        table.add_column("Key", style="bold yellow")
-        table.add_column("Action", style="white")
-
-        table.add_row("1", "Start Server")
-        table.add_row("2", "Stop Server (RCON)")
-        table.add_row("", "")
-        table.add_row("", "[dim]── Server Mode ──[/dim]")
-        table.add_row("p", "[cyan]Production Mode[/cyan] (copy of backup, all mods)")
-        table.add_row("f", "[green]Fresh World Mode[/green] (new world, all mods)")
-        table.add_row("v", "[yellow]Vanilla Debug Mode[/yellow] (new world, Fabric only)")
-        table.add_row("", "")
-        table.add_row("", "[dim]── World Sync (Production ↔ Local) ──[/dim]")
-        table.add_row("d", "Download World Data [dim](excludes DistantHorizons)[/dim]")
-        table.add_row("D", "Download World + DH [dim](full download, rare)[/dim]")
-        table.add_row("h", "Download DistantHorizons [dim](to cold storage)[/dim]")
-        table.add_row("u", "[red]Upload World to Production[/red] [dim](server offline)[/dim]")
-        table.add_row("H", "Upload DistantHorizons [dim](server can be online)[/dim]")
-        table.add_row("", "")
-        table.add_row("", "[dim]── Local World Management ──[/dim]")
-        table.add_row("4", "Reset Local World (from backup)")
-        table.add_row("5", "Delete Fresh World")
-        table.add_row("6", "Delete Vanilla World")
-        table.add_row("", "")
-        table.add_row("", "[dim]── Modpack Version ──[/dim]")
-        table.add_row("l", "List Versions")
-        table.add_row("c", "Change Version")
-        table.add_row("b", "Back to Main Branch")
-        table.add_row("", "")
-        table.add_row("", "[dim]── Utilities ──[/dim]")
-        table.add_row("m", "Sync Mods (from mrpack)")
-        table.add_row("o", "Grant Permissions (op via LuckPerms)")
-        table.add_row("r", "Send RCON Command")
-        table.add_row("s", "Show Status")
-        table.add_row("", "")
-        table.add_row("q", "Quit")
-
         console.print(table)
         console.print()
 
-        choice = Prompt.ask("Select", choices=["1", "2", "d", "D", "h", "u", "H", "4", "5", "6", "p", "f", "v", "l", "c", "b", "m", "o", "r", "s", "q"], default="q")
+        choice = Prompt.ask("Select", choices=MENU_CHOICES, default="q")
 
         if choice == "1":
             start_server()
@@ -2770,117 +4127,202 @@ def interactive_menu():
 # Main / CLI
 # =============================================================================
 
-if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-
-        if command == "start":
-            start_server()
-        elif command == "stop":
-            stop_server()
-        elif command == "status":
-            show_status()
-        elif command == "mode":
-            if len(sys.argv) < 3:
-                console.print("[yellow]Usage: python server-config.py mode <production|fresh|vanilla>[/yellow]")
-            elif sys.argv[2] == "production":
-                switch_to_production_mode()
-            elif sys.argv[2] == "fresh":
-                switch_to_fresh_mode()
-            elif sys.argv[2] == "vanilla":
-                switch_to_vanilla_mode()
-            else:
-                console.print(f"[red]Unknown mode: {sys.argv[2]}[/red]")
-                console.print("[dim]Valid modes: production, fresh, vanilla[/dim]")
-        elif command == "reset-world":
-            if len(sys.argv) < 3:
-                console.print("[yellow]Usage: python server-config.py reset-world <fresh|vanilla|production|local>[/yellow]")
-            else:
-                reset_world(sys.argv[2])
-        elif command == "reset-local":
-            reset_local_world()
-        elif command == "clear-mods":
-            clear_mods()
-        elif command == "sync-mods":
-            sync_mods_full()
-        elif command == "download-world":
-            include_dh = "--include-dh" in sys.argv or "--full" in sys.argv
-            auto_confirm = "-y" in sys.argv or "--yes" in sys.argv
-            no_backup = "--no-backup" in sys.argv
-            download_world(backup_existing=not no_backup, auto_confirm=auto_confirm, include_dh=include_dh)
-        elif command == "download-dh":
-            auto_confirm = "-y" in sys.argv or "--yes" in sys.argv
-            download_distant_horizons(auto_confirm=auto_confirm)
-        elif command == "upload-world":
-            auto_confirm = "-y" in sys.argv or "--yes" in sys.argv
-            upload_world(auto_confirm=auto_confirm)
-        elif command == "upload-dh":
-            auto_confirm = "-y" in sys.argv or "--yes" in sys.argv
-            upload_distant_horizons(auto_confirm=auto_confirm)
-        elif command == "version":
-            if len(sys.argv) < 3:
-                # No subcommand, show current version
-                version, vtype = get_mcc_current_version()
-                console.print(f"[bold]MCC Version:[/bold] [cyan]{version}[/cyan] ({vtype})")
-                if is_mcc_dirty():
-                    console.print("[yellow]⚠ Uncommitted changes present[/yellow]")
-            elif sys.argv[2] == "list":
-                list_versions()
-            elif sys.argv[2] == "main":
-                # Special case: return to main branch
-                return_to_main()
-            else:
-                # Treat as version tag to switch to
-                switch_version(sys.argv[2])
-        elif command == "rcon":
-            if len(sys.argv) < 3:
-                console.print("[yellow]Usage: python server-config.py rcon <command>[/yellow]")
-            else:
-                cmd = " ".join(sys.argv[2:])
-                response = send_rcon_command(cmd)
-                if response:
-                    console.print(response)
-        elif command == "grant-perms" or command == "op":
-            if len(sys.argv) < 3:
-                console.print("[yellow]Usage: python server-config.py grant-perms <username>[/yellow]")
-            else:
-                grant_permissions(sys.argv[2])
-        else:
-            console.print("[yellow]Usage:[/yellow]")
-            console.print("  python server-config.py              # Interactive menu")
-            console.print("  python server-config.py start        # Start server")
-            console.print("  python server-config.py stop         # Stop server via RCON")
-            console.print("  python server-config.py status       # Show current status")
-            console.print("")
-            console.print("[yellow]Server Mode:[/yellow]")
-            console.print("  python server-config.py mode production  # Copy of backup, all mods")
-            console.print("  python server-config.py mode fresh       # New world, all mods")
-            console.print("  python server-config.py mode vanilla     # New world, Fabric only")
-            console.print("")
-            console.print("[yellow]World Sync (Production ↔ Local):[/yellow]")
-            console.print("  python server-config.py download-world       # Download world (excludes DH)")
-            console.print("  python server-config.py download-world --full  # Download with DistantHorizons")
-            console.print("  python server-config.py download-dh          # Download DH to cold storage")
-            console.print("  python server-config.py upload-world         # Upload world (server offline)")
-            console.print("  python server-config.py upload-dh            # Upload DH from cold storage")
-            console.print("")
-            console.print("[dim]  Options: -y (skip prompts), --no-backup (skip local backup)[/dim]")
-            console.print("")
-            console.print("[yellow]Local World Management:[/yellow]")
-            console.print("  python server-config.py reset-local      # Reset world-local from backup")
-            console.print("  python server-config.py reset-world <mode>  # Delete world folders")
-            console.print("                                           # (fresh, vanilla, production, local)")
-            console.print("")
-            console.print("[yellow]Modpack Version:[/yellow]")
-            console.print("  python server-config.py version          # Show current MCC version")
-            console.print("  python server-config.py version list     # List available versions")
-            console.print("  python server-config.py version <tag>    # Switch to specific version")
-            console.print("  python server-config.py version main     # Return to main branch")
-            console.print("")
-            console.print("[yellow]Utilities:[/yellow]")
-            console.print("  python server-config.py sync-mods        # Sync mods from mrpack")
-            console.print("  python server-config.py clear-mods       # Remove non-API mods")
-            console.print("  python server-config.py grant-perms <user>  # Grant op via LuckPerms")
-            console.print("  python server-config.py rcon <cmd>       # Send RCON command")
+# Command-line usage summary, printed in one console.print()
+USAGE = "\n".join((
+    "[yellow]Usage:[/yellow]",
+    "  python server-config.py              # Interactive menu",
+    "  python server-config.py start        # Start server",
+    "  python server-config.py stop         # Stop server via RCON",
+    "  python server-config.py status       # Show current status",
+    "                                       # (--quick: skip world sizes, --json: for scripts)",
+    "",
+    "[yellow]Server Mode:[/yellow]",
+    "  python server-config.py mode production  # Copy of backup, all mods",
+    "  python server-config.py mode fresh       # New world, all mods",
+    "  python server-config.py mode vanilla     # New world, Fabric only",
+    "",
+    "[yellow]World Sync (Production ↔ Local):[/yellow]",
+    "  python server-config.py download-world       # Download world (excludes DH)",
+    "  python server-config.py download-world --full  # Download with DistantHorizons",
+    "  python server-config.py download-dh          # Download DH to cold storage",
+    "  python server-config.py upload-world         # Upload world (server offline)",
+    "  python server-config.py upload-dh            # Upload DH from cold storage",
+    "",
+    "[dim]  Options: -y (skip prompts), --no-backup (skip local backup),[/dim]",
+    "[dim]           --no-scan (download-world: skip the sizing pass),[/dim]",
+    "[dim]           --workers N (download-world: parallel SFTP channels, default 8)[/dim]",
+    "",
+    "[yellow]Local World Management:[/yellow]",
+    "  python server-config.py reset-local      # Reset world-local from backup",
+    "                                           # (--force-clean: full delete + copy)",
+    "  python server-config.py reset-world <mode>  # Delete world folders",
+    "                                           # (fresh, vanilla, production, local)",
+    "",
+    "[yellow]Modpack Version:[/yellow]",
+    "  python server-config.py version          # Show current MCC version",
+    "  python server-config.py version list     # List available versions",
+    "  python server-config.py version <tag>    # Switch to specific version",
+    "  python server-config.py version main     # Return to main branch",
+    "",
+    "[yellow]Utilities:[/yellow]",
+    "  python server-config.py sync-mods        # Sync mods from mrpack",
+    "  python server-config.py clear-mods       # Remove non-API mods",
+    "  python server-config.py grant-perms <user>  # Grant op via LuckPerms",
+    "  python server-config.py rcon <cmd>       # Send RCON command",
+    "  python server-config.py rcon-batch \\[file]  # Send commands (one per line, file or stdin)",
+    "",
+    "[dim]  --no-color before the command prints plain text (CI logs)[/dim]",
+))
+
+
+def print_usage():
+    """Print the command-line usage summary."""
+    console.print(USAGE)
+
+
+class CliParser(argparse.ArgumentParser):
+    """ArgumentParser that answers bad input with the usage summary above."""
+
+    def error(self, message):
+        console.print(f"[red]{escape(message)}[/red]\n")
+        print_usage()
+        sys.exit(2)
+
+
+def cmd_version(args):
+    """version [list|main|<tag>]"""
+    if args.target is None:
+        # No subcommand, show current version
+        version, vtype = get_mcc_current_version()
+        console.print(f"[bold]MCC Version:[/bold] [cyan]{version}[/cyan] ({vtype})")
+        if is_mcc_dirty():
+            console.print("[yellow]⚠ Uncommitted changes present[/yellow]")
+    elif args.target == "list":
+        list_versions()
+    elif args.target == "main":
+        # Special case: return to main branch
+        return_to_main()
+    else:
+        # Treat as version tag to switch to
+        switch_version(args.target)
+
+
+def cmd_rcon(args):
+    """rcon <command...>"""
+    if not args.rcon_args:
+        console.print("[yellow]Usage: python server-config.py rcon <command>[/yellow]")
+        return
+    response = send_rcon_command(" ".join(args.rcon_args))
+    if response:
+        # Verbatim: server text can contain [brackets] Rich would read as markup
+        sys.stdout.write(response + "\n")
+
+
+def cmd_rcon_batch(args):
+    """rcon-batch [file]"""
+    # Commands one per line from a file, or stdin if no file is given
+    if args.file:
+        with open(args.file, 'r') as f:
+            lines = f.read().splitlines()
     else:
+        lines = sys.stdin.read().splitlines()
+    cmds = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+    responses = send_rcon_batch(cmds) if cmds else []
+    for cmd, response in zip(cmds, responses or []):
+        console.print(f"[dim]> {escape(cmd)}[/dim]")
+        if response:
+            # Verbatim, as in cmd_rcon
+            sys.stdout.write(response + "\n")
+
+
+MODE_SWITCHERS = {
+    "production": switch_to_production_mode,
+    "fresh": switch_to_fresh_mode,
+    "vanilla": switch_to_vanilla_mode,
+}
+
+
+def build_parser():
+    """Build the command-line parser; each subcommand sets a handler(args)."""
+    parser = CliParser(prog="server-config.py", add_help=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("--no-color", action="store_true", help="Plain output (no ANSI colors)")
+    sub = parser.add_subparsers(dest="command")
+
+    def add(name, handler, aliases=()):
+        cmd = sub.add_parser(name, aliases=list(aliases), add_help=False)
+        cmd.set_defaults(handler=handler)
+        return cmd
+
+    def add_yes(cmd):
+        cmd.add_argument("-y", "--yes", dest="auto_confirm", action="store_true")
+
+    add("start", lambda a: start_server())
+    add("stop", lambda a: stop_server())
+    cmd = add("status", lambda a: show_status(quick=a.quick, as_json=a.json))
+    cmd.add_argument("--quick", action="store_true")
+    cmd.add_argument("--json", action="store_true")
+    add("mode", lambda a: MODE_SWITCHERS[a.mode]()).add_argument("mode", choices=list(MODE_SWITCHERS))
+    add("reset-world", lambda a: reset_world(a.mode)).add_argument("mode")
+    add("reset-local", lambda a: reset_local_world(force_clean=a.force_clean)).add_argument(
+        "--force-clean", action="store_true")
+    add("clear-mods", lambda a: clear_mods())
+    add("sync-mods", lambda a: sync_mods_full())
+
+    cmd = add("download-world", lambda a: download_world(
+        backup_existing=not a.no_backup, auto_confirm=a.auto_confirm,
+        include_dh=a.include_dh, scan_first=not a.no_scan, workers=a.workers))
+    add_yes(cmd)
+    cmd.add_argument("--include-dh", "--full", dest="include_dh", action="store_true")
+    cmd.add_argument("--no-backup", action="store_true")
+    cmd.add_argument("--no-scan", action="store_true")
+    cmd.add_argument("--workers", type=int, default=SFTP_DOWNLOAD_WORKERS)
+
+    add_yes(add("download-dh", lambda a: download_distant_horizons(auto_confirm=a.auto_confirm)))
+    add_yes(add("upload-world", lambda a: upload_world(auto_confirm=a.auto_confirm)))
+    add_yes(add("upload-dh", lambda a: upload_distant_horizons(auto_confirm=a.auto_confirm)))
+
+    add("version", cmd_version).add_argument("target", nargs="?")
+    add("rcon", cmd_rcon).add_argument("rcon_args", nargs=argparse.REMAINDER)
+    add("rcon-batch", cmd_rcon_batch).add_argument("file", nargs="?")
+    add("grant-perms", lambda a: grant_permissions(a.username), aliases=["op"]).add_argument("username")
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse the command line (default: sys.argv[1:]).
+
+    Everything after "rcon" is the server command and is passed through
+    verbatim, even words starting with "-" that argparse would reject.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser()
+    # Global options take no values, so the first other word is the command
+    for i, word in enumerate(argv):
+        if not word.startswith('-'):
+            if word == "rcon":
+                args = parser.parse_args(argv[:i + 1])
+                args.rcon_args = list(argv[i + 1:])
+                return args
+            break
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run one CLI command, or the interactive menu when none is given."""
+    global console
+
+    args = parse_args(argv)
+    if args.no_color:
+        console = _Lazy(lambda: Console(no_color=True, force_terminal=False))
+    if args.help:
+        print_usage()
+    elif args.command is None:
         interactive_menu()
+    else:
+        args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
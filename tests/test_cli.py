@@ -0,0 +1,35 @@
+"""Command-line parsing tests for server-config.py.
+
+Run with: python -m unittest discover tests
+"""
+import importlib.util
+import os
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server-config.py")
+
+# The script's name has a dash, so it can't be imported normally
+_spec = importlib.util.spec_from_file_location("server_config", SCRIPT)
+server_config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(server_config)
+
+
+class RconArgsTest(unittest.TestCase):
+    def test_leading_dash_word_is_passed_through(self):
+        args = server_config.parse_args(["rcon", "--help-me"])
+        self.assertEqual(args.command, "rcon")
+        self.assertEqual(args.rcon_args, ["--help-me"])
+
+    def test_words_keep_their_order(self):
+        args = server_config.parse_args(["--no-color", "rcon", "-x", "say", "hi"])
+        self.assertTrue(args.no_color)
+        self.assertEqual(args.rcon_args, ["-x", "say", "hi"])
+
+    def test_command_name_is_not_overwritten(self):
+        args = server_config.parse_args(["rcon", "say", "hi"])
+        self.assertEqual(args.command, "rcon")
+        self.assertEqual(args.rcon_args, ["say", "hi"])
+
+
+if __name__ == "__main__":
+    unittest.main()